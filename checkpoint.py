@@ -0,0 +1,135 @@
+"""
+Checkpoints of completed pipeline tasks, used to resume failed runs.
+
+The result of every completed task is pickled into a directory named
+after the run's arguments, together with a manifest of the completed
+tasks. A resumed run with the same arguments restores those results
+instead of running the tasks again.
+"""
+import os
+import json
+import pickle
+import shutil
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+def run_key(**run_args):
+    """
+    Compute the key identifying a pipeline run.
+    
+    Arguments naming existing files also contribute the size and
+    modification time of the file, so a changed input is never resumed.
+    
+    Args:
+        **run_args: Arguments of the run
+        
+    Returns:
+        str: The run key
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    for name in sorted(run_args):
+        value = run_args[name]
+        digest.update(f"{name}={value!r}".encode())
+        
+        if isinstance(value, str) and os.path.isfile(value):
+            stat = os.stat(value)
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    
+    return digest.hexdigest()
+
+class Checkpoint:
+    """Completed task results of a single pipeline run, stored on disk."""
+    
+    def __init__(self, checkpoint_dir, key):
+        """
+        Initialize the checkpoint.
+        
+        Args:
+            checkpoint_dir (str): Directory holding the checkpoints of all runs
+            key (str): Key of the run, see run_key()
+        """
+        self.path = os.path.join(checkpoint_dir, key)
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """
+        Load the results of the completed tasks.
+        
+        Returns:
+            dict: Dictionary mapping task names to their results
+        """
+        manifest = self._read_manifest()
+        results = {}
+        
+        for name, file_name in manifest.items():
+            try:
+                with open(os.path.join(self.path, file_name), 'rb') as f:
+                    results[name] = pickle.load(f)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable checkpoint of task '{name}': {e}")
+        
+        if results:
+            logger.info(f"Loaded checkpoint with {len(results)} completed tasks from {self.path}")
+        return results
+    
+    def save(self, name, result):
+        """
+        Store the result of a completed task.
+        
+        Args:
+            name (str): Task name
+            result (object): Result of the task
+            
+        Returns:
+            bool: True if the result was stored, False otherwise
+        """
+        file_name = f"{hashlib.blake2b(name.encode(), digest_size=8).hexdigest()}.pkl"
+        
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            _write_atomic(os.path.join(self.path, file_name),
+                          lambda f: pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL))
+            
+            # Record the task only once its result is on disk
+            with self._lock:
+                manifest = self._read_manifest()
+                manifest[name] = file_name
+                _write_atomic(os.path.join(self.path, MANIFEST_FILE),
+                              lambda f: f.write(json.dumps(manifest, indent=2).encode()))
+            return True
+        
+        except Exception as e:
+            logger.warning(f"Could not checkpoint task '{name}': {e}")
+            return False
+    
+    def clear(self):
+        """Remove the checkpoint."""
+        if os.path.exists(self.path):
+            shutil.rmtree(self.path, ignore_errors=True)
+            logger.info(f"Removed checkpoint {self.path}")
+    
+    def _read_manifest(self):
+        """Read the manifest of completed tasks."""
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return {}
+        
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+def _write_atomic(path, write):
+    """Write a file through a temporary file, so a crash never leaves partial data."""
+    temp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            write(f)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -20,16 +20,120 @@ DEFAULT_JSON_PATH = os.path.join(DEFAULT_DATA_DIR, "hospitals.json")
 DEFAULT_API_URL = "https://data.cdc.gov/resource/vbim-akqf.json"  # COVID-19 Case Surveillance Public Use Data
 DEFAULT_HTML_URL = "https://covid.cdc.gov/covid-data-tracker/#datatracker-home"
 
+# Streaming settings
+# Rows per chunk when the pipeline is run in streaming mode
+CSV_CHUNK_SIZE = 100000
+
+# Concurrency settings
+# Number of pipeline tasks that may run at the same time (1 = sequential)
+MAX_WORKERS = 1
+
+# Run each dataset's transformation and validation in its own worker process
+PROCESS_BRANCHES = False
+
+# Split datasets of at least PARTITION_MIN_ROWS rows into this many row
+# partitions, transformed in parallel worker processes (1 = no partitioning)
+PARTITIONS = 1
+PARTITION_MIN_ROWS = 100000
+
+# Memory settings
+# Copy extracted data once for the first transformer and let the later
+# ones modify it in place, instead of copying it at every step
+COPY_FREE_TRANSFORMS = False
+
+# API paging settings
+# Records per page when paging through the API (None = single request)
+API_PAGE_SIZE = None
+API_MAX_WORKERS = 4
+API_MAX_RECORDS = None
+
+# HTTP client settings
+# Connections kept alive per host, at least API_MAX_WORKERS
+HTTP_POOL_SIZE = 10
+HTTP_TIMEOUT = 30
+HTTP_RETRIES = 3
+# Revalidate API and web responses with ETag / Last-Modified and reuse the
+# cached data while the server answers 304 Not Modified
+HTTP_CACHE = False
+HTTP_CACHE_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "http_cache")
+
+# Input fingerprinting
+# Skip the CSV and JSON datasets whose files have not changed since they were
+# last loaded (compared by size, modification time and content hash)
+SKIP_UNCHANGED_INPUTS = False
+
+# Stage cache
+# Reuse the outputs of extraction and transformation steps whose inputs and
+# code have not changed, stored as Arrow IPC files
+STAGE_CACHE = False
+STAGE_CACHE_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "stage_cache")
+STAGE_CACHE_MAX_MB = 1024
+
+# Checkpoints
+# Save the result of every completed task so that failed runs can be resumed
+# with --resume; a successful run removes its checkpoint
+CHECKPOINT_TASKS = False
+CHECKPOINT_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "checkpoints")
+
+# Intermediate storage
+# Directory to hand DataFrames between stages and worker processes through as
+# memory-mapped Arrow IPC files (None keeps them in memory)
+INTERMEDIATE_DIR = None
+DEFAULT_INTERMEDIATE_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "intermediate")
+
+# Validation settings
+# "exact" evaluates each expectation on its own, "compiled" computes the
+# statistics of each column once and evaluates all expectations on them,
+# "sampled" evaluates them on a sample of the rows with confidence bounds
+# and estimates distinct counts with HyperLogLog
+VALIDATION_MODE = "exact"
+# Rows validated in sampled mode, a fraction of the rows if set or else a fixed number
+VALIDATION_SAMPLE_FRACTION = None
+VALIDATION_SAMPLE_SIZE = 1000000
+
 # Database settings
 DB_PATH = os.path.join(DEFAULT_OUTPUT_DIR, "covid19.db")
 DB_URI = f"sqlite:///{DB_PATH}"
 
+# Bulk loading through sqlite3 with WAL journaling and batched inserts
+SQLITE_FAST_LOAD = False
+SQLITE_CHUNK_SIZE = 50000
+SQLITE_CACHE_SIZE_KB = 65536
+
+# Columnar inputs
+# Parquet and Arrow IPC inputs are read with column projection and only the
+# rows dated within START_DATE and END_DATE (YYYY-MM-DD, None for no bound)
+START_DATE = None
+END_DATE = None
+# Columns read from columnar inputs by table, tables not listed read every column
+COLUMNAR_COLUMNS = {}
+
+# Parquet export
+# Export the transformed datasets as Parquet datasets, partitioned by the
+# partition columns they have, compressed and dictionary encoded
+EXPORT_PARQUET = False
+PARQUET_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "parquet")
+PARQUET_COMPRESSION = "zstd"
+PARQUET_PARTITION_COLUMNS = ["date", "region"]
+
 # Table names
 CASES_TABLE = "covid_cases"
 HOSPITALS_TABLE = "hospital_resources"
 VACCINATIONS_TABLE = "vaccinations"
 COMBINED_TABLE = "covid_combined"
 
+# Incremental loading upserts rows on each table's natural key
+# instead of replacing the tables on every run
+INCREMENTAL_LOAD = False
+NATURAL_KEYS = {
+    CASES_TABLE: ["date", "region"],
+    HOSPITALS_TABLE: ["date", "hospital_name"],
+    VACCINATIONS_TABLE: ["date", "region"]
+}
+# The CDC case surveillance API has one record per case rather than one per
+# date and region, so its records are keyed on their Socrata row id instead
+SOCRATA_NATURAL_KEY = ["record_id"]
+
 # Logging configuration
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -2,59 +2,148 @@
 Module for extracting vaccination data from API endpoints.
 """
 import logging
-import requests
 import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from utils import get_dataframe_info
+from extractors.http_client import http_get, read_cached_frame, write_cached_frame
 
 logger = logging.getLogger(__name__)
 
-def extract_from_api(api_url, params=None, headers=None):
+# Fields used as watermark for incremental extraction. Socrata APIs such as
+# data.cdc.gov expose the last update time of every record as a system field.
+SOCRATA_WATERMARK_FIELD = ':updated_at'
+DEFAULT_WATERMARK_FIELD = 'date'
+
+# Column holding the Socrata row id (:id), which identifies a record across runs
+SOCRATA_RECORD_ID = 'record_id'
+
+# Page size of incremental Socrata requests without a $limit, Socrata's own default
+SOCRATA_PAGE_SIZE = 1000
+
+def is_socrata(api_url):
+    """Check if an API endpoint is a Socrata API, such as data.cdc.gov."""
+    return "data.cdc.gov" in api_url
+
+def extract_from_api(api_url, params=None, headers=None, since=None, watermark_field=None,
+                     page_size=None, max_workers=1, max_records=None, cache_dir=None):
     """
     Extract vaccination data from an API endpoint.
     
+    The highest value of the watermark field in the extracted records is
+    stored in ``df.attrs['watermark']``, so that a later run can pass it
+    back as ``since`` to fetch only newer records. Records at the watermark
+    itself are fetched again, since more records can share its value.
+    
+    Socrata APIs filter on the watermark on the server and the delta is
+    fetched in pages, as a dataset refresh can give more records the same
+    update time than fit in one response. Other APIs return every record
+    and the older ones are filtered out after the download.
+    
     Args:
         api_url (str): URL of the API endpoint
         params (dict, optional): Query parameters to include in the request
         headers (dict, optional): Headers to include in the request
-        
+        since (str, optional): Only extract records with a watermark field value
+                               greater than or equal to this one
+        watermark_field (str, optional): Field used as watermark (default: ':updated_at'
+                                         for Socrata APIs, 'date' otherwise)
+        page_size (int, optional): Fetch all records in pages of this size using
+                                   $limit/$offset instead of a single request
+        max_workers (int, optional): Number of pages to fetch concurrently
+        max_records (int, optional): Stop paging after this many records
+        cache_dir (str, optional): Cache the response in this directory and reuse
+                                   the extracted DataFrame while the API answers
+                                   304 Not Modified (single requests only)
+                                   
     Returns:
         pandas.DataFrame: DataFrame containing the API data
     """
     logger.info(f"Extracting data from API: {api_url}")
     
+    socrata = is_socrata(api_url)
+    if watermark_field is None:
+        watermark_field = SOCRATA_WATERMARK_FIELD if socrata else DEFAULT_WATERMARK_FIELD
+    
     try:
         # Set default values if None
         if params is None:
             # Add CDC-specific parameters for COVID-19 data
             # Limit to 500 records and filter to get vaccination data where possible
-            if "data.cdc.gov" in api_url:
+            if socrata:
                 params = {
                     '$limit': 500,
                     '$where': 'vaccination_status IS NOT NULL'
                 }
             else:
                 params = {}
-                
+        
+        # Let Socrata return only the records from the watermark on, oldest
+        # first. Records updated together share the watermark value and may
+        # not all fit in one window, so the boundary value is read again;
+        # incremental loads upsert, so the repeated records are harmless.
+        if socrata and since is not None:
+            params = dict(params)
+            escaped_since = str(since).replace("'", "''")
+            newer = f"{watermark_field} >= '{escaped_since}'"
+            params['$where'] = f"({params['$where']}) AND {newer}" if params.get('$where') else newer
+            params['$order'] = watermark_field
+            logger.info(f"Requesting records with {newer}")
+            
+            # A single window of $limit records could hold only records at the
+            # watermark, which would then never move, so the delta is paged
+            if not page_size:
+                page_size = int(params.get('$limit', SOCRATA_PAGE_SIZE))
+        
+        # System fields such as :id and :updated_at are only returned when selected
+        if socrata and '$select' not in params:
+            system_fields = [':id'] + ([watermark_field] if watermark_field.startswith(':') else [])
+            params = dict(params)
+            params['$select'] = ', '.join(['*'] + list(dict.fromkeys(system_fields)))
+        
         if headers is None:
             headers = {'Content-Type': 'application/json'}
         
-        # Make API request
-        response = requests.get(api_url, params=params, headers=headers)
+        # Arguments besides the response body that shape the DataFrame
+        response = None
+        cache_variant = ('api', since, watermark_field)
         
-        # Check response status
-        if response.status_code != 200:
-            logger.error(f"API request failed with status code: {response.status_code}")
-            return pd.DataFrame()
-        
-        # Parse JSON response
-        data = response.json()
+        if page_size:
+            # Paging needs a stable order, Socrata's :id breaks any ties
+            if socrata:
+                params = dict(params)
+                order = params.get('$order')
+                params['$order'] = f"{order}, :id" if order else ':id'
+            
+            data = fetch_pages(api_url, params, headers, page_size,
+                               max_workers=max_workers, max_records=max_records)
+        else:
+            # Make API request
+            response = http_get(api_url, params=params, headers=headers, cache_dir=cache_dir)
+            
+            # Check response status
+            if response.status_code != 200:
+                logger.error(f"API request failed with status code: {response.status_code}")
+                return pd.DataFrame()
+            
+            # Reuse the DataFrame of the last run if the data has not changed
+            cached_df = read_cached_frame(cache_dir, response, cache_variant)
+            if cached_df is not None:
+                logger.info(f"API data not modified, using {len(cached_df)} cached records")
+                return cached_df
+            
+            # Parse JSON response
+            data = response.json()
+            
+            if isinstance(data, list) and '$limit' in params and len(data) >= int(params['$limit']):
+                logger.warning(f"API returned {len(data)} records, the $limit; the result may be truncated")
         
         # Convert to DataFrame
         if isinstance(data, list):
             df = pd.DataFrame(data)
             
             # CDC data-specific transformations
-            if "data.cdc.gov" in api_url:
+            if socrata:
                 # CDC data requires column renaming for consistency with our schema
                 column_mapping = {
                     'case_month': 'date',
@@ -72,12 +161,35 @@ def extract_from_api(api_url, params=None, headers=None):
                 # Create a combined vaccination_status column if it doesn't exist
                 if 'vaccination_status' not in df.columns and 'process_state' in df.columns:
                     df['vaccination_status'] = df['process_state']
+                
+                # Keep the row id, the records have no natural key
+                if ':id' in df.columns:
+                    df = df.rename(columns={':id': SOCRATA_RECORD_ID})
         
         elif isinstance(data, dict) and 'data' in data:
             df = pd.DataFrame(data['data'])
         else:
             df = pd.json_normalize(data)
         
+        # Track the watermark and filter out older records, keeping those at
+        # the watermark, which may have arrived late for the last loaded day
+        watermark = None
+        if watermark_field in df.columns:
+            if since is not None and not socrata:
+                df = df[df[watermark_field].astype(str) >= str(since)].reset_index(drop=True)
+            
+            if not df.empty:
+                watermark = str(df[watermark_field].max())
+            
+            # Socrata system fields are not part of our schema
+            if watermark_field.startswith(':'):
+                df = df.drop(columns=[watermark_field])
+        
+        df.attrs['watermark'] = watermark
+        
+        if response is not None:
+            write_cached_frame(cache_dir, response, df, cache_variant)
+        
         # Log dataframe info
         get_dataframe_info(df, name="API data")
         
@@ -86,4 +198,85 @@ def extract_from_api(api_url, params=None, headers=None):
     
     except Exception as e:
         logger.error(f"Error extracting data from API: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+def fetch_pages(api_url, params, headers, page_size, max_workers=1, max_records=None):
+    """
+    Fetch all records of a paginated API using $limit/$offset.
+    
+    Up to max_workers pages are requested at once. Pages are consumed in
+    order and paging stops at the first page with fewer than page_size
+    records, so the result is the same as one request for all records.
+    It also stops, with a warning, when the API ignores $limit or $offset,
+    i.e. a page has more than page_size records or repeats the previous one.
+    
+    Args:
+        api_url (str): URL of the API endpoint
+        params (dict): Query parameters to include in every request
+        headers (dict): Headers to include in every request
+        page_size (int): Number of records per page
+        max_workers (int, optional): Number of pages to fetch concurrently
+        max_records (int, optional): Stop after this many records
+        
+    Returns:
+        list: Records of all pages, in order
+    """
+    def fetch_page(page_number):
+        """Fetch the records of a single page."""
+        page_params = dict(params, **{'$limit': page_size, '$offset': page_number * page_size})
+        response = http_get(api_url, params=page_params, headers=headers)
+        
+        if response.status_code != 200:
+            raise RuntimeError(f"API request for page {page_number} failed with status code: {response.status_code}")
+        
+        return _payload_records(response.json())
+    
+    records = []
+    previous_page = None
+    max_workers = max(1, max_workers)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Keep max_workers pages in flight, consuming them in order
+        futures = deque(executor.submit(fetch_page, page_number) for page_number in range(max_workers))
+        next_page = max_workers
+        
+        while futures:
+            page = futures.popleft().result()
+            
+            # An API ignoring $offset would return the same page forever
+            repeated = bool(page) and page == previous_page
+            if repeated:
+                logger.warning(f"API returned the same page twice, it does not support $offset; "
+                               f"stopping after {len(records)} records")
+            else:
+                records.extend(page)
+            
+            oversized = len(page) > page_size
+            if oversized:
+                logger.warning(f"API returned {len(page)} records for a page of {page_size}, "
+                               f"it does not support $limit; stopping")
+            
+            if (repeated or oversized or len(page) < page_size
+                    or (max_records is not None and len(records) >= max_records)):
+                # Pages still in flight lie past the end and are discarded
+                for future in futures:
+                    future.cancel()
+                break
+            
+            futures.append(executor.submit(fetch_page, next_page))
+            next_page += 1
+            previous_page = page
+    
+    if max_records is not None:
+        records = records[:max_records]
+    
+    logger.info(f"Fetched {len(records)} records in pages of {page_size} with {max_workers} workers")
+    return records
+
+def _payload_records(data):
+    """Get the list of records from a JSON API response."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and isinstance(data.get('data'), list):
+        return data['data']
+    raise ValueError("Paginated API response does not contain a list of records")
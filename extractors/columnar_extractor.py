@@ -0,0 +1,192 @@
+"""
+Module for extracting data from columnar Parquet and Arrow IPC files.
+
+Files are read through pyarrow.dataset, so only the requested columns
+are read and a date range is pushed down to the scan: Parquet row groups
+whose date statistics fall outside the range are skipped without being
+read.
+"""
+import os
+import logging
+import pandas as pd
+from utils import get_dataframe_info
+
+logger = logging.getLogger(__name__)
+
+# File extensions of columnar files, mapped to their pyarrow.dataset format
+COLUMNAR_FORMATS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'ipc',
+    '.feather': 'ipc',
+    '.ipc': 'ipc'
+}
+
+# Column the date range is applied to
+DATE_COLUMN = "date"
+
+def columnar_format(file_path):
+    """Get the pyarrow.dataset format of a columnar file from its extension, or None."""
+    return COLUMNAR_FORMATS.get(os.path.splitext(file_path)[1].lower())
+
+def is_columnar(file_path):
+    """Check if a file is a Parquet or Arrow IPC file, by its extension."""
+    return columnar_format(file_path) is not None
+
+def extract_from_columnar(file_path, columns=None, start_date=None, end_date=None, date_column=DATE_COLUMN):
+    """
+    Extract data from a Parquet or Arrow IPC file.
+    
+    Args:
+        file_path (str): Path to the Parquet or Arrow IPC file
+        columns (list, optional): Columns to read (default: all columns)
+        start_date (str, optional): First date to read, in YYYY-MM-DD format
+        end_date (str, optional): Last date to read, in YYYY-MM-DD format
+        date_column (str, optional): Column the date range is applied to
+        
+    Returns:
+        pandas.DataFrame: DataFrame containing the selected columns and rows
+    """
+    logger.info(f"Extracting data from columnar file: {file_path}")
+    
+    try:
+        # Check if file exists
+        if not os.path.exists(file_path):
+            logger.error(f"Columnar file not found: {file_path}")
+            return pd.DataFrame()
+        
+        dataset = _open_dataset(file_path)
+        table = dataset.to_table(**_scan_options(dataset.schema, columns, start_date, end_date, date_column))
+        df = table.to_pandas()
+        
+        # Log dataframe info
+        get_dataframe_info(df, name="Columnar data")
+        
+        logger.info(f"Successfully extracted {len(df)} records from columnar file")
+        return df
+    
+    except Exception as e:
+        logger.error(f"Error extracting data from columnar file: {e}")
+        return pd.DataFrame()
+
+def extract_columnar_chunks(file_path, chunksize, columns=None, start_date=None, end_date=None,
+                            date_column=DATE_COLUMN):
+    """
+    Extract data from a Parquet or Arrow IPC file in bounded-size chunks.
+    
+    Args:
+        file_path (str): Path to the Parquet or Arrow IPC file
+        chunksize (int): Maximum number of rows per chunk
+        columns (list, optional): Columns to read (default: all columns)
+        start_date (str, optional): First date to read, in YYYY-MM-DD format
+        end_date (str, optional): Last date to read, in YYYY-MM-DD format
+        date_column (str, optional): Column the date range is applied to
+        
+    Yields:
+        pandas.DataFrame: DataFrame containing the next chunk of columnar data
+    """
+    logger.info(f"Streaming data from columnar file: {file_path} ({chunksize} rows per chunk)")
+    
+    # Check if file exists
+    if not os.path.exists(file_path):
+        logger.error(f"Columnar file not found: {file_path}")
+        return
+    
+    total_rows = 0
+    
+    try:
+        dataset = _open_dataset(file_path)
+        batches = dataset.to_batches(batch_size=chunksize,
+                                     **_scan_options(dataset.schema, columns, start_date, end_date, date_column))
+        for batch in batches:
+            # Filtered row groups can leave empty batches behind
+            if batch.num_rows == 0:
+                continue
+            total_rows += batch.num_rows
+            yield batch.to_pandas()
+    
+    except Exception as e:
+        # Earlier chunks may already have been processed, so stopping
+        # silently would leave a partial load behind
+        logger.error(f"Error streaming data from columnar file after {total_rows} records: {e}")
+        raise
+    
+    logger.info(f"Successfully streamed {total_rows} records from columnar file")
+
+def _open_dataset(file_path):
+    """Open a Parquet or Arrow IPC file as a pyarrow dataset."""
+    import pyarrow.dataset as ds
+    
+    return ds.dataset(file_path, format=columnar_format(file_path) or 'parquet')
+
+def _scan_options(schema, columns, start_date, end_date, date_column):
+    """
+    Build the column projection and date filter of a dataset scan.
+    
+    String dates are compared as text, so they must be in ISO format.
+    The end date is inclusive, timestamps on that day are read as well.
+    Date columns of other types are not filtered.
+    
+    Args:
+        schema (pyarrow.Schema): Schema of the dataset
+        columns (list): Columns to read, or None for all columns
+        start_date (str): First date to read, or None
+        end_date (str): Last date to read, or None
+        date_column (str): Column the date range is applied to
+        
+    Returns:
+        dict: 'columns' and 'filter' arguments for Dataset.to_table and Dataset.to_batches
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    
+    options = {}
+    
+    if columns is not None:
+        missing = [column for column in columns if column not in schema.names]
+        if missing:
+            logger.warning(f"Columns not found in columnar file: {', '.join(missing)}")
+        options['columns'] = [column for column in columns if column in schema.names]
+    
+    if start_date is None and end_date is None:
+        return options
+    
+    if date_column not in schema.names:
+        logger.warning(f"Date column '{date_column}' not found in columnar file, reading every date")
+        return options
+    
+    # Dictionary-encoded columns, e.g. written from a pandas categorical, compare as their values
+    field_type = schema.field(date_column).type
+    if pa.types.is_dictionary(field_type):
+        field_type = field_type.value_type
+    
+    text = pa.types.is_string(field_type) or pa.types.is_large_string(field_type)
+    if not (text or pa.types.is_timestamp(field_type) or pa.types.is_date(field_type)):
+        logger.warning(f"Date column '{date_column}' has type {field_type} in columnar file, reading every date")
+        return options
+    
+    field = ds.field(date_column)
+    bounds = []
+    
+    # Read from the start of the first day up to the start of the day after the last one
+    for value, lower in ((start_date, True), (end_date, False)):
+        if value is None:
+            continue
+        
+        bound = pd.Timestamp(value).normalize()
+        if not lower:
+            bound += pd.Timedelta(days=1)
+        
+        try:
+            if text:
+                scalar = pa.scalar(bound.strftime('%Y-%m-%d'), type=field_type)
+            else:
+                scalar = pa.scalar(bound.to_pydatetime()).cast(field_type)
+        except pa.ArrowException as e:
+            logger.warning(f"Cannot filter date column '{date_column}' of type {field_type}, reading every date: {e}")
+            return options
+        
+        bounds.append(field >= scalar if lower else field < scalar)
+    
+    options['filter'] = bounds[0] if len(bounds) == 1 else bounds[0] & bounds[1]
+    return options
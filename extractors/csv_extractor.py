@@ -37,4 +37,42 @@ def extract_from_csv(file_path):
     
     except Exception as e:
         logger.error(f"Error extracting data from CSV: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+def extract_csv_chunks(file_path, chunksize):
+    """
+    Extract COVID-19 case data from a CSV file in bounded-size chunks.
+    
+    Only one chunk is held in memory at a time, so peak memory depends on
+    the chunk size rather than the size of the file.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        chunksize (int): Maximum number of rows per chunk
+        
+    Yields:
+        pandas.DataFrame: DataFrame containing the next chunk of CSV data
+    """
+    logger.info(f"Streaming data from CSV file: {file_path} ({chunksize} rows per chunk)")
+    
+    # Check if file exists
+    if not os.path.exists(file_path):
+        logger.error(f"CSV file not found: {file_path}")
+        return
+    
+    total_rows = 0
+    
+    try:
+        # Read CSV file lazily, one chunk at a time
+        with pd.read_csv(file_path, chunksize=chunksize) as reader:
+            for chunk in reader:
+                total_rows += len(chunk)
+                yield chunk
+    
+    except Exception as e:
+        # Earlier chunks may already have been processed, so stopping
+        # silently would leave a partial load behind
+        logger.error(f"Error streaming data from CSV after {total_rows} records: {e}")
+        raise
+    
+    logger.info(f"Successfully streamed {total_rows} records from CSV")
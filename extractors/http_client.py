@@ -0,0 +1,275 @@
+"""
+Module providing a shared HTTP session for the API and web extractors.
+
+All requests go through one requests.Session, so connections are kept
+alive and reused across requests, pages and scheduled pipeline runs.
+Responses can be cached on disk and revalidated with conditional requests
+(ETag / Last-Modified).
+"""
+import os
+import json
+import glob
+import hashlib
+import logging
+import threading
+import requests
+import pandas as pd
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Default client settings, see configure_http()
+HTTP_SETTINGS = {
+    'pool_size': 10,
+    'timeout': 30,
+    'retries': 3
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+def configure_http(pool_size=None, timeout=None, retries=None):
+    """
+    Configure the shared HTTP client.
+    
+    The session is only recreated when a setting actually changes, so
+    calling this on every pipeline run keeps pooled connections alive.
+    
+    Args:
+        pool_size (int, optional): Maximum number of connections kept per host
+        timeout (float, optional): Connect and read timeout in seconds
+        retries (int, optional): Number of retries for connection errors and 502/503/504 responses
+    """
+    global _session
+    
+    settings = {
+        'pool_size': HTTP_SETTINGS['pool_size'] if pool_size is None else pool_size,
+        'timeout': HTTP_SETTINGS['timeout'] if timeout is None else timeout,
+        'retries': HTTP_SETTINGS['retries'] if retries is None else retries
+    }
+    
+    with _session_lock:
+        if settings != HTTP_SETTINGS:
+            HTTP_SETTINGS.update(settings)
+            if _session is not None:
+                _session.close()
+                _session = None
+            logger.info(f"Configured HTTP client: {HTTP_SETTINGS}")
+
+def get_session():
+    """
+    Get the shared HTTP session, creating it on first use.
+    
+    Returns:
+        requests.Session: Session with a connection pool sized for concurrent requests
+    """
+    global _session
+    
+    with _session_lock:
+        if _session is None:
+            _session = _create_session(HTTP_SETTINGS['pool_size'], HTTP_SETTINGS['retries'])
+        return _session
+
+def http_get(url, params=None, headers=None, timeout=None, cache_dir=None):
+    """
+    Send a GET request through the shared HTTP session.
+    
+    With a cache directory, responses carrying an ETag or Last-Modified
+    header are stored on disk. Later requests for the same URL and params
+    send If-None-Match / If-Modified-Since, and a 304 Not Modified answer
+    is turned into a 200 response with the cached body.
+    
+    Args:
+        url (str): URL to request
+        params (dict, optional): Query parameters to include in the request
+        headers (dict, optional): Headers to include in the request
+        timeout (float, optional): Timeout in seconds (default: the configured timeout)
+        cache_dir (str, optional): Directory of the conditional request cache
+        
+    Returns:
+        requests.Response: The response, with ``from_cache`` set to True if the
+                           body was served from the cache
+    """
+    if timeout is None:
+        timeout = HTTP_SETTINGS['timeout']
+    
+    if not cache_dir:
+        return get_session().get(url, params=params, headers=headers, timeout=timeout)
+    
+    # Revalidate the cached response, if there is one
+    key = _cache_key(url, params)
+    entry = _read_cache_entry(cache_dir, key)
+    request_headers = dict(headers or {})
+    if entry:
+        if entry.get('etag'):
+            request_headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            request_headers['If-Modified-Since'] = entry['last_modified']
+    
+    response = get_session().get(url, params=params, headers=request_headers, timeout=timeout)
+    
+    if response.status_code == 304 and entry:
+        logger.info(f"Not modified, serving {url} from the HTTP cache")
+        response = _cached_response(response, cache_dir, key, entry)
+    else:
+        response.from_cache = False
+        if response.status_code == 200 and ('ETag' in response.headers or 'Last-Modified' in response.headers):
+            _write_cache_entry(cache_dir, key, response)
+    
+    response.cache_key = key
+    return response
+
+def read_cached_frame(cache_dir, response, variant=None):
+    """
+    Get the DataFrame previously extracted from a response served from the cache.
+    
+    Args:
+        cache_dir (str): Directory of the conditional request cache
+        response (requests.Response): Response returned by http_get
+        variant (object, optional): Extractor arguments the DataFrame depends on
+                                    besides the response body
+        
+    Returns:
+        pandas.DataFrame: The cached DataFrame, with ``attrs['not_modified']`` set,
+                          or None if the response is new or nothing was stored
+    """
+    if not cache_dir or not getattr(response, 'from_cache', False):
+        return None
+    
+    path = _cache_path(cache_dir, response.cache_key, _variant_suffix(variant))
+    if not os.path.exists(path):
+        return None
+    
+    try:
+        df = pd.read_pickle(path)
+    except Exception as e:
+        logger.warning(f"Could not read cached DataFrame {path}: {e}")
+        return None
+    
+    df.attrs['not_modified'] = True
+    return df
+
+def write_cached_frame(cache_dir, response, df, variant=None):
+    """
+    Store the DataFrame extracted from a cached response.
+    
+    Args:
+        cache_dir (str): Directory of the conditional request cache
+        response (requests.Response): Response returned by http_get
+        df (pandas.DataFrame): DataFrame extracted from the response
+        variant (object, optional): Extractor arguments the DataFrame depends on
+                                    besides the response body
+    """
+    key = getattr(response, 'cache_key', None)
+    if not cache_dir or key is None or not os.path.exists(_cache_path(cache_dir, key, 'body')):
+        return
+    
+    try:
+        _write_atomic(_cache_path(cache_dir, key, _variant_suffix(variant)), df.to_pickle)
+    except Exception as e:
+        logger.warning(f"Could not cache DataFrame for {response.url}: {e}")
+
+def _cache_key(url, params):
+    """Get the cache key of a request."""
+    request = json.dumps([url, sorted((params or {}).items())], default=str)
+    return hashlib.sha256(request.encode()).hexdigest()
+
+def _cache_path(cache_dir, key, suffix):
+    """Get the path of a cache file."""
+    return os.path.join(cache_dir, f"{key}.{suffix}")
+
+def _variant_suffix(variant):
+    """Get the cache file suffix of a DataFrame variant."""
+    return f"{hashlib.sha256(repr(variant).encode()).hexdigest()[:16]}.pkl"
+
+def _read_cache_entry(cache_dir, key):
+    """Read the validators of a cached response, or None if it is not cached."""
+    entry_path = _cache_path(cache_dir, key, 'json')
+    if not os.path.exists(entry_path) or not os.path.exists(_cache_path(cache_dir, key, 'body')):
+        return None
+    
+    try:
+        with open(entry_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable HTTP cache entry {entry_path}: {e}")
+        return None
+
+def _write_cache_entry(cache_dir, key, response):
+    """Store the body and validators of a response."""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        # DataFrames extracted from the previous body are stale now
+        for path in glob.glob(_cache_path(cache_dir, key, '*.pkl')):
+            os.remove(path)
+        
+        entry = {
+            'url': response.url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'headers': {
+                name: value for name, value in response.headers.items()
+                if name.lower() in ('content-type', 'etag', 'last-modified')
+            }
+        }
+        
+        # Write the body first, an entry is only used when its body exists
+        _write_atomic(_cache_path(cache_dir, key, 'body'), lambda path: _write_bytes(path, response.content))
+        _write_atomic(_cache_path(cache_dir, key, 'json'), lambda path: _write_bytes(path, json.dumps(entry).encode()))
+    
+    except Exception as e:
+        logger.warning(f"Could not cache response of {response.url}: {e}")
+
+def _cached_response(not_modified, cache_dir, key, entry):
+    """Build a 200 response from the cache for a 304 Not Modified response."""
+    with open(_cache_path(cache_dir, key, 'body'), 'rb') as f:
+        body = f.read()
+    
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = 'OK'
+    response.url = not_modified.url
+    response.request = not_modified.request
+    response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+    response._content = body
+    response.from_cache = True
+    return response
+
+def _write_atomic(path, write):
+    """Write a file through a temporary file, so readers never see partial data."""
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def _write_bytes(path, data):
+    """Write bytes to a file."""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def _create_session(pool_size, retries):
+    """Create a session with pooled, retrying adapters and compressed responses."""
+    session = requests.Session()
+    
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
+    # Let servers send gzip or deflate compressed payloads
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+    
+    logger.info(f"Created HTTP session with a pool of {pool_size} connections per host")
+    return session
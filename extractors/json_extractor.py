@@ -2,23 +2,37 @@
 Module for extracting hospital resource data from JSON files.
 """
 import os
+import re
 import json
 import logging
 import pandas as pd
 from utils import get_dataframe_info
+from extractors.ndjson_extractor import is_ndjson, extract_from_ndjson
 
 logger = logging.getLogger(__name__)
 
+# Characters read from the file at a time when streaming
+JSON_BLOCK_SIZE = 1 << 20
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
 def extract_from_json(file_path):
     """
     Extract hospital resource data from a JSON file.
     
+    Newline-delimited JSON files (.ndjson, .jsonl) are extracted with
+    extract_from_ndjson.
+    
     Args:
         file_path (str): Path to the JSON file
         
     Returns:
         pandas.DataFrame: DataFrame containing the JSON data
     """
+    # Newline-delimited JSON holds one record per line
+    if is_ndjson(file_path):
+        return extract_from_ndjson(file_path)
+    
     logger.info(f"Extracting data from JSON file: {file_path}")
     
     try:
@@ -47,4 +61,169 @@ def extract_from_json(file_path):
     
     except Exception as e:
         logger.error(f"Error extracting data from JSON: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+def extract_json_chunks(file_path, chunksize, block_size=JSON_BLOCK_SIZE):
+    """
+    Extract hospital resource data from a JSON file in bounded-size chunks.
+    
+    The records of a top-level array, or of the array under the top-level
+    "data" key, are decoded one at a time from buffered reads, so peak
+    memory depends on the chunk size rather than the size of the file.
+    Any other "data" value is read whole and converted to records the way
+    extract_from_json converts it. A top-level object without a "data" key
+    is normalized into a single chunk.
+    Newline-delimited JSON files (.ndjson, .jsonl) are read line by line.
+    
+    Args:
+        file_path (str): Path to the JSON file
+        chunksize (int): Maximum number of records per chunk
+        block_size (int, optional): Number of characters read at a time
+        
+    Yields:
+        pandas.DataFrame: DataFrame containing the next chunk of JSON records
+    """
+    logger.info(f"Streaming data from JSON file: {file_path} ({chunksize} records per chunk)")
+    
+    # Check if file exists
+    if not os.path.exists(file_path):
+        logger.error(f"JSON file not found: {file_path}")
+        return
+    
+    total_rows = 0
+    
+    try:
+        with open(file_path, 'r') as f:
+            records = []
+            if is_ndjson(file_path):
+                all_records = _iter_ndjson_records(f)
+            else:
+                all_records = _iter_json_records(_JSONReader(f, block_size))
+            
+            for record in all_records:
+                records.append(record)
+                if len(records) == chunksize:
+                    total_rows += len(records)
+                    yield pd.DataFrame(records)
+                    records = []
+            
+            if records:
+                total_rows += len(records)
+                yield pd.DataFrame(records)
+    
+    except Exception as e:
+        # Earlier chunks may already have been processed, so stopping
+        # silently would leave a partial load behind
+        logger.error(f"Error streaming data from JSON after {total_rows} records: {e}")
+        raise
+    
+    logger.info(f"Successfully streamed {total_rows} records from JSON")
+
+class _JSONReader:
+    """Buffered reader decoding one JSON value at a time from a text file."""
+    
+    def __init__(self, f, block_size):
+        """Initialize the reader on a text file, reading block_size characters at a time."""
+        self.f = f
+        self.block_size = block_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+    
+    def peek(self):
+        """Skip whitespace and get the next character, or an empty string at the end."""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or not self._read():
+                return self.buffer[self.pos:self.pos + 1]
+    
+    def expect(self, characters):
+        """Consume the next character, which must be one of the given characters."""
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(f"Expected one of {characters!r} at offset {self.pos} of the buffer, got {character!r}")
+        self.pos += 1
+        return character
+    
+    def value(self):
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                
+                # A number ending with the buffer may continue in the next block
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            
+            self._read()
+    
+    def _read(self):
+        """Read the next block, dropping the consumed part of the buffer."""
+        if self.eof:
+            return False
+        
+        block = self.f.read(self.block_size)
+        if not block:
+            self.eof = True
+            return False
+        
+        self.buffer = self.buffer[self.pos:] + block
+        self.pos = 0
+        return True
+
+def _iter_json_records(reader):
+    """Yield the records of a top-level array or "data" value, or the normalized top-level value."""
+    if reader.peek() == '[':
+        yield from _iter_json_array(reader)
+        return
+    
+    if reader.peek() != '{':
+        yield from pd.json_normalize(reader.value()).to_dict('records')
+        return
+    
+    # Look for the "data" array among the keys of the top-level object
+    reader.expect('{')
+    fields = {}
+    if reader.peek() == '}':
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.value()
+            reader.expect(':')
+            if key == 'data':
+                if reader.peek() == '[':
+                    yield from _iter_json_array(reader)
+                else:
+                    # Read like extract_from_json does, e.g. an object of columns
+                    yield from pd.DataFrame(reader.value()).to_dict('records')
+                return
+            
+            fields[key] = reader.value()
+            if reader.expect(',}') == '}':
+                break
+    
+    yield from pd.json_normalize(fields).to_dict('records')
+
+def _iter_ndjson_records(f):
+    """Yield the records on the non-blank lines of a newline-delimited JSON file."""
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+def _iter_json_array(reader):
+    """Yield the elements of the JSON array starting at the reader's position."""
+    reader.expect('[')
+    if reader.peek() == ']':
+        reader.pos += 1
+        return
+    
+    while True:
+        yield reader.value()
+        if reader.expect(',]') == ']':
+            return
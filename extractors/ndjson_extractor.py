@@ -0,0 +1,125 @@
+"""
+Module for extracting hospital resource data from newline-delimited JSON files.
+
+The file is split at line boundaries into byte ranges, the ranges are
+parsed in parallel worker processes and the resulting DataFrames are
+concatenated in file order.
+"""
+import os
+import json
+import logging
+import pandas as pd
+from utils import get_dataframe_info
+from worker_pool import process_pool
+
+logger = logging.getLogger(__name__)
+
+# File extensions of newline-delimited JSON (NDJSON / JSON Lines)
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+# Smallest byte range worth parsing in its own worker process
+NDJSON_MIN_RANGE_BYTES = 8 << 20
+
+def is_ndjson(file_path):
+    """Check if a file is newline-delimited JSON, by its extension."""
+    return file_path.lower().endswith(NDJSON_EXTENSIONS)
+
+def extract_from_ndjson(file_path, workers=None, min_range_bytes=NDJSON_MIN_RANGE_BYTES):
+    """
+    Extract hospital resource data from a newline-delimited JSON file.
+    
+    Every non-blank line holds one record. The result is the DataFrame
+    extract_from_json builds from a JSON array of the same records.
+    
+    Args:
+        file_path (str): Path to the NDJSON file
+        workers (int, optional): Number of worker processes (default: number of CPUs)
+        min_range_bytes (int, optional): Smallest byte range parsed by its own worker
+        
+    Returns:
+        pandas.DataFrame: DataFrame containing the NDJSON records
+    """
+    logger.info(f"Extracting data from NDJSON file: {file_path}")
+    
+    try:
+        # Check if file exists
+        if not os.path.exists(file_path):
+            logger.error(f"NDJSON file not found: {file_path}")
+            return pd.DataFrame()
+        
+        ranges = split_lines(file_path, workers or os.cpu_count() or 1, min_range_bytes=min_range_bytes)
+        
+        # Small files are parsed in this process
+        if len(ranges) <= 1:
+            frames = [parse_lines(file_path, start, stop) for start, stop in ranges]
+        else:
+            logger.info(f"Parsing {len(ranges)} byte ranges in worker processes")
+            with process_pool(max_workers=len(ranges)) as executor:
+                futures = [executor.submit(parse_lines, file_path, start, stop) for start, stop in ranges]
+                frames = [future.result() for future in futures]
+        
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            df = pd.DataFrame()
+        elif len(frames) == 1:
+            df = frames[0]
+        else:
+            # Ranges may infer different dtypes for a column, infer them again
+            # from the combined values like a single DataFrame of all records
+            df = pd.concat(frames, ignore_index=True).infer_objects()
+        
+        # Log dataframe info
+        get_dataframe_info(df, name="NDJSON data")
+        
+        logger.info(f"Successfully extracted {len(df)} records from NDJSON")
+        return df
+    
+    except Exception as e:
+        logger.error(f"Error extracting data from NDJSON: {e}")
+        return pd.DataFrame()
+
+def split_lines(file_path, parts, min_range_bytes=0):
+    """
+    Split a file into byte ranges that start and end at line boundaries.
+    
+    Args:
+        file_path (str): Path to the file
+        parts (int): Maximum number of ranges
+        min_range_bytes (int, optional): Smallest range size, fewer ranges are made for small files
+        
+    Returns:
+        list: (start, stop) byte offsets of the non-empty ranges, in file order
+    """
+    size = os.path.getsize(file_path)
+    parts = max(1, min(parts, size // max(min_range_bytes, 1)))
+    
+    bounds = [0]
+    with open(file_path, 'rb') as f:
+        for part in range(1, parts):
+            # Move each boundary forward to the start of the next line
+            target = max(size * part // parts, bounds[-1] + 1)
+            f.seek(target - 1)
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    
+    return [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+def parse_lines(file_path, start, stop):
+    """
+    Parse the records on the lines of a byte range, in a worker process.
+    
+    Args:
+        file_path (str): Path to the NDJSON file
+        start (int): Offset of the first line
+        stop (int): Offset after the last line
+        
+    Returns:
+        pandas.DataFrame: DataFrame containing the records of the range
+    """
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(stop - start)
+    
+    records = [json.loads(line) for line in data.splitlines() if line.strip()]
+    return pd.DataFrame(records)
@@ -2,23 +2,26 @@
 Module for extracting COVID-19 data from web pages by scraping HTML tables.
 """
 import logging
-import requests
 import pandas as pd
 from bs4 import BeautifulSoup
 from utils import get_dataframe_info
+from extractors.http_client import http_get, read_cached_frame, write_cached_frame
 import os
 from urllib.parse import urlparse
 from io import StringIO
 
 logger = logging.getLogger(__name__)
 
-def extract_from_web(url, table_index=0):
+def extract_from_web(url, table_index=0, cache_dir=None):
     """
     Extract COVID-19 data from an HTML table on a web page.
     
     Args:
         url (str): URL of the web page containing the HTML table
         table_index (int, optional): Index of the table to extract (default: 0)
+        cache_dir (str, optional): Cache the page in this directory and reuse the
+                                   extracted DataFrame while the server answers
+                                   304 Not Modified
         
     Returns:
         pandas.DataFrame: DataFrame containing the extracted table data
@@ -31,6 +34,8 @@ def extract_from_web(url, table_index=0):
         # Modify URL to point to the cases by county view which has accessible tables
         url = "https://covid.cdc.gov/covid-data-tracker/#county-view"
     
+    response = None
+    
     try:
         # Check if URL is a local file
         parsed_url = urlparse(url)
@@ -55,13 +60,19 @@ def extract_from_web(url, table_index=0):
             soup = BeautifulSoup(html_content, 'html5lib')
         else:
             # Make request to web page
-            response = requests.get(url)
+            response = http_get(url, cache_dir=cache_dir)
             
             # Check response status
             if response.status_code != 200:
                 logger.error(f"Web request failed with status code: {response.status_code}")
                 return pd.DataFrame()
             
+            # Reuse the DataFrame of the last run if the page has not changed
+            cached_df = read_cached_frame(cache_dir, response, ('web', table_index))
+            if cached_df is not None:
+                logger.info(f"Web page not modified, using {len(cached_df)} cached records")
+                return cached_df
+            
             # Parse HTML
             soup = BeautifulSoup(response.text, 'html.parser')
         
@@ -127,6 +138,9 @@ def extract_from_web(url, table_index=0):
         # Clean column names
         df.columns = [str(col).strip().lower().replace(' ', '_') for col in df.columns]
         
+        if response is not None:
+            write_cached_frame(cache_dir, response, df, ('web', table_index))
+        
         # Log dataframe info
         get_dataframe_info(df, name="Web data")
         
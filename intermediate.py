@@ -0,0 +1,164 @@
+"""
+Memory-mapped intermediate storage of pipeline stage outputs.
+
+DataFrames handed from one stage to the next are written to uncompressed
+Arrow IPC files and read back through a memory map, so their data lives
+in the operating system's page cache instead of the process heap. Worker
+processes and resumed runs open the same files instead of receiving
+pickled copies of the data.
+
+Frames read zero-copy are backed by the read-only mapping, so they must
+not be modified in place.
+"""
+import os
+import glob
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Subdirectory of the given directory that the store owns, so clearing it
+# never touches other files there
+STORE_SUBDIRECTORY = "etl_intermediate"
+
+class StoredFrame:
+    """Reference to a DataFrame in an intermediate store, saved in checkpoints in its place."""
+    
+    def __init__(self, path, attrs):
+        """
+        Initialize the reference.
+        
+        Args:
+            path (str): Path to the Arrow IPC file holding the DataFrame
+            attrs (dict): DataFrame attrs, which Arrow does not store
+        """
+        self.path = path
+        self.attrs = attrs
+        
+        # The file of a later run may replace this one
+        stat = os.stat(path)
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+    
+    def exists(self):
+        """Check if the file still holds the referenced DataFrame."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns)
+
+class IntermediateStore:
+    """Directory of memory-mapped Arrow IPC files, one per task output."""
+    
+    def __init__(self, directory, zero_copy=True):
+        """
+        Initialize the store.
+        
+        Args:
+            directory (str): Directory to store the files in, within its own
+                             etl_intermediate subdirectory
+            zero_copy (bool, optional): Read frames backed by the memory map. Disable this
+                                        if stages modify their input frames in place.
+        """
+        self.directory = os.path.join(directory, STORE_SUBDIRECTORY)
+        self.zero_copy = zero_copy
+        os.makedirs(self.directory, exist_ok=True)
+    
+    def put(self, name, df):
+        """
+        Store the output DataFrame of a task.
+        
+        Args:
+            name (str): Task name
+            df (pandas.DataFrame): Output of the task
+            
+        Returns:
+            StoredFrame: Reference to the stored DataFrame, or None if it could not be stored
+        """
+        path = os.path.join(self.directory, f"{hashlib.blake2b(name.encode(), digest_size=8).hexdigest()}.arrow")
+        
+        try:
+            write_frame(df, path)
+            return StoredFrame(path, dict(df.attrs))
+        except Exception as e:
+            # Columns mixing Python types have no Arrow equivalent
+            logger.info(f"Keeping the output of task '{name}' in memory, it cannot be stored: {e}")
+            return None
+    
+    def get(self, stored):
+        """
+        Open a stored DataFrame.
+        
+        Args:
+            stored (StoredFrame): Reference returned by put()
+            
+        Returns:
+            pandas.DataFrame: The DataFrame, or None if its file was replaced or removed
+        """
+        if not stored.exists():
+            return None
+        
+        df = read_frame(stored.path, zero_copy=self.zero_copy)
+        df.attrs = dict(stored.attrs)
+        return df
+    
+    def clear(self):
+        """Remove the Arrow IPC files and temporary files written to the store."""
+        paths = glob.glob(os.path.join(self.directory, "*.arrow")) + glob.glob(os.path.join(self.directory, "*.tmp"))
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError as e:
+                # Mapped files cannot be removed on every platform, those are left behind
+                logger.warning(f"Could not remove intermediate file {path}: {e}")
+
+def write_frame(df, path):
+    """
+    Write a DataFrame to an uncompressed Arrow IPC file, which can be memory-mapped.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to write
+        path (str): Path to the file
+    """
+    import pyarrow as pa
+    
+    table = pa.Table.from_pandas(df)
+    
+    # Write through a temporary file, so a crash never leaves partial data
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with pa.OSFile(temp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def read_frame(path, zero_copy=False, rows=None):
+    """
+    Read a DataFrame from an Arrow IPC file through a memory map.
+    
+    Args:
+        path (str): Path to the file
+        zero_copy (bool, optional): Back the columns by the read-only memory map where
+                                    possible, instead of copying them into the process
+        rows (tuple, optional): (start, stop) positions of the rows to read
+        
+    Returns:
+        pandas.DataFrame: The DataFrame
+    """
+    import pyarrow as pa
+    
+    with pa.memory_map(path, 'r') as source:
+        table = pa.ipc.open_file(source).read_all()
+        
+        if rows is not None:
+            start, stop = rows
+            table = table.slice(start, stop - start)
+        
+        if zero_copy:
+            return table.to_pandas(split_blocks=True)
+        return table.to_pandas()
@@ -8,7 +8,7 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-def export_to_csv(df, file_path=None, output_dir=None, prefix='covid_data'):
+def export_to_csv(df, file_path=None, output_dir=None, prefix='covid_data', append=False):
     """
     Export DataFrame to a CSV file.
     
@@ -17,6 +17,7 @@ def export_to_csv(df, file_path=None, output_dir=None, prefix='covid_data'):
         file_path (str, optional): Path to the output CSV file
         output_dir (str, optional): Directory for output if file_path not provided
         prefix (str, optional): Filename prefix if file_path not provided
+        append (bool, optional): Append rows without a header to an existing file
         
     Returns:
         str: Path to the created CSV file, or None if export failed
@@ -41,7 +42,10 @@ def export_to_csv(df, file_path=None, output_dir=None, prefix='covid_data'):
             file_path = os.path.join(output_dir, f"{prefix}_{timestamp}.csv")
         
         # Export DataFrame to CSV
-        df.to_csv(file_path, index=False)
+        if append:
+            df.to_csv(file_path, index=False, mode='a', header=False)
+        else:
+            df.to_csv(file_path, index=False)
         
         logger.info(f"Successfully exported {len(df)} rows to CSV: {file_path}")
         return file_path
@@ -0,0 +1,153 @@
+"""
+Module for storing pipeline metadata, such as extraction watermarks and
+input file fingerprints, in SQLite.
+"""
+import logging
+import sqlite3
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Table holding the latest loaded watermark of each source
+WATERMARKS_TABLE = "etl_watermarks"
+
+# Table holding the fingerprint of the input file last loaded into each table
+FINGERPRINTS_TABLE = "etl_fingerprints"
+
+def get_watermark(db_uri, source):
+    """
+    Get the stored watermark of a data source.
+    
+    Args:
+        db_uri (str): SQLite database URI
+        source (str): Name or URL of the data source
+        
+    Returns:
+        str: The latest loaded watermark, or None if there is none
+    """
+    try:
+        conn = _connect(db_uri)
+        try:
+            row = conn.execute(
+                f"SELECT watermark FROM {WATERMARKS_TABLE} WHERE source = ?", (source,)
+            ).fetchone()
+        finally:
+            conn.close()
+        
+        watermark = row[0] if row else None
+        logger.info(f"Watermark for '{source}': {watermark}")
+        return watermark
+    
+    except Exception as e:
+        logger.error(f"Error reading watermark for '{source}': {e}")
+        return None
+
+def set_watermark(db_uri, source, watermark):
+    """
+    Store the watermark of a data source.
+    
+    Args:
+        db_uri (str): SQLite database URI
+        source (str): Name or URL of the data source
+        watermark (str): The latest loaded watermark
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        conn = _connect(db_uri)
+        try:
+            with conn:
+                conn.execute(
+                    f"INSERT INTO {WATERMARKS_TABLE} (source, watermark, updated_at) VALUES (?, ?, ?) "
+                    f"ON CONFLICT (source) DO UPDATE SET watermark = excluded.watermark, "
+                    f"updated_at = excluded.updated_at",
+                    (source, str(watermark), datetime.now().isoformat(timespec='seconds'))
+                )
+        finally:
+            conn.close()
+        
+        logger.info(f"Stored watermark for '{source}': {watermark}")
+        return True
+    
+    except Exception as e:
+        logger.error(f"Error storing watermark for '{source}': {e}")
+        return False
+
+def get_fingerprint(db_uri, source):
+    """
+    Get the stored fingerprint of an input file.
+    
+    Args:
+        db_uri (str): SQLite database URI
+        source (str): Name of the data source, such as the table the file is loaded into
+        
+    Returns:
+        dict: The fingerprint of the last loaded file, or None if there is none
+    """
+    try:
+        conn = _connect(db_uri)
+        try:
+            row = conn.execute(
+                f"SELECT path, size, mtime_ns, hash FROM {FINGERPRINTS_TABLE} WHERE source = ?", (source,)
+            ).fetchone()
+        finally:
+            conn.close()
+        
+        if row is None:
+            return None
+        return dict(zip(('path', 'size', 'mtime_ns', 'hash'), row))
+    
+    except Exception as e:
+        logger.error(f"Error reading fingerprint for '{source}': {e}")
+        return None
+
+def set_fingerprint(db_uri, source, fingerprint):
+    """
+    Store the fingerprint of an input file.
+    
+    Args:
+        db_uri (str): SQLite database URI
+        source (str): Name of the data source, such as the table the file is loaded into
+        fingerprint (dict): Fingerprint as returned by utils.file_fingerprint
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        conn = _connect(db_uri)
+        try:
+            with conn:
+                conn.execute(
+                    f"INSERT INTO {FINGERPRINTS_TABLE} (source, path, size, mtime_ns, hash, updated_at) "
+                    f"VALUES (?, ?, ?, ?, ?, ?) "
+                    f"ON CONFLICT (source) DO UPDATE SET path = excluded.path, size = excluded.size, "
+                    f"mtime_ns = excluded.mtime_ns, hash = excluded.hash, updated_at = excluded.updated_at",
+                    (source, fingerprint['path'], fingerprint['size'], fingerprint['mtime_ns'],
+                     fingerprint['hash'], datetime.now().isoformat(timespec='seconds'))
+                )
+        finally:
+            conn.close()
+        
+        logger.info(f"Stored fingerprint for '{source}': {fingerprint['hash']}")
+        return True
+    
+    except Exception as e:
+        logger.error(f"Error storing fingerprint for '{source}': {e}")
+        return False
+
+def _connect(db_uri):
+    """Connect to the database and make sure the metadata tables exist."""
+    # Extract database path from URI
+    db_path = db_uri.replace('sqlite:///', '')
+    
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {WATERMARKS_TABLE} "
+        f"(source TEXT PRIMARY KEY, watermark TEXT, updated_at TEXT)"
+    )
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {FINGERPRINTS_TABLE} "
+        f"(source TEXT PRIMARY KEY, path TEXT, size INTEGER, mtime_ns INTEGER, hash TEXT, updated_at TEXT)"
+    )
+    return conn
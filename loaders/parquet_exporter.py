@@ -0,0 +1,75 @@
+"""
+Module for exporting data to partitioned Parquet datasets.
+
+Each dataset is a directory of Parquet files in hive layout, e.g.
+``covid_cases/date=2023-01-15/region=California/<id>-0.parquet``, written
+with compression and dictionary encoding so that BI jobs can prune both
+partitions and columns when reading.
+"""
+import os
+import shutil
+import logging
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Columns the datasets are partitioned by, those missing from a DataFrame are skipped
+DEFAULT_PARTITION_COLUMNS = ("date", "region")
+
+# Parquet files are written one per partition; allow every day of a few years
+MAX_PARTITIONS = 100000
+
+def export_to_parquet(df, dataset_dir, partition_cols=DEFAULT_PARTITION_COLUMNS, compression="zstd",
+                      append=False):
+    """
+    Export DataFrame to a partitioned Parquet dataset.
+    
+    Datetime partition columns are partitioned by day. The partition
+    columns are stored in the directory names instead of the files.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to export
+        dataset_dir (str): Directory of the Parquet dataset
+        partition_cols (iterable, optional): Columns to partition by, in directory order
+        compression (str, optional): Parquet compression codec
+        append (bool, optional): Add files to an existing dataset instead of replacing it
+        
+    Returns:
+        str: Path to the dataset directory, or None if export failed
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    try:
+        # Check if DataFrame is empty
+        if df.empty:
+            logger.error("Cannot export empty DataFrame to Parquet")
+            return None
+        
+        partition_cols = [column for column in partition_cols if column in df.columns]
+        
+        # Partition timestamps by day, as YYYY-MM-DD directory names
+        day_columns = [column for column in partition_cols if pd.api.types.is_datetime64_any_dtype(df[column])]
+        if day_columns:
+            df = df.assign(**{column: df[column].dt.strftime('%Y-%m-%d') for column in day_columns})
+        
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        
+        # Replace the whole dataset unless appending to it
+        if not append and os.path.exists(dataset_dir):
+            shutil.rmtree(dataset_dir)
+        os.makedirs(dataset_dir, exist_ok=True)
+        
+        pq.write_to_dataset(
+            table, dataset_dir, partition_cols=partition_cols or None,
+            compression=compression, use_dictionary=True,
+            existing_data_behavior='overwrite_or_ignore', max_partitions=MAX_PARTITIONS
+        )
+        
+        logger.info(f"Successfully exported {len(df)} rows to Parquet: {dataset_dir} "
+                    f"(partitioned by {', '.join(partition_cols) or 'nothing'})")
+        return dataset_dir
+    
+    except Exception as e:
+        logger.error(f"Error exporting data to Parquet: {e}")
+        return None
@@ -8,7 +8,15 @@ from sqlalchemy import create_engine
 
 logger = logging.getLogger(__name__)
 
-def load_to_sqlite(df, table_name, db_uri, if_exists='replace', index=False):
+# Connection settings used by the fast loader
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY'
+}
+
+def load_to_sqlite(df, table_name, db_uri, if_exists='replace', index=False, fast=False,
+                   chunk_size=50000, cache_size_kb=65536, key_columns=None):
     """
     Load DataFrame to SQLite database.
     
@@ -20,7 +28,14 @@ def load_to_sqlite(df, table_name, db_uri, if_exists='replace', index=False):
                        - 'fail': Raise a ValueError
                        - 'replace': Drop the table before inserting new values
                        - 'append': Insert new values to the existing table
+                       - 'upsert': Insert new rows and update changed rows,
+                         matched on key_columns (always uses the fast loader)
         index (bool): Write DataFrame index as a column
+        fast (bool): Bulk load through sqlite3 with WAL journaling and batched
+                     executemany calls in a single transaction
+        chunk_size (int): Rows per executemany batch in fast mode
+        cache_size_kb (int): SQLite page cache size in KiB in fast mode
+        key_columns (list, optional): Natural key columns used by 'upsert'
         
     Returns:
         bool: True if successful, False otherwise
@@ -33,6 +48,11 @@ def load_to_sqlite(df, table_name, db_uri, if_exists='replace', index=False):
             logger.error("Cannot load empty DataFrame to database")
             return False
         
+        if fast or if_exists == 'upsert':
+            return bulk_load_to_sqlite(df, table_name, db_uri, if_exists=if_exists, index=index,
+                                       chunk_size=chunk_size, cache_size_kb=cache_size_kb,
+                                       key_columns=key_columns)
+        
         # Create SQLAlchemy engine
         engine = create_engine(db_uri)
         
@@ -58,6 +78,235 @@ def load_to_sqlite(df, table_name, db_uri, if_exists='replace', index=False):
         logger.error(f"Error loading data to SQLite: {e}")
         return False
 
+def bulk_load_to_sqlite(df, table_name, db_uri, if_exists='replace', index=False,
+                        chunk_size=50000, cache_size_kb=65536, key_columns=None):
+    """
+    Bulk load a DataFrame to SQLite with sqlite3.
+    
+    Rows are inserted in large executemany batches inside a single
+    transaction, on a connection tuned for write throughput. Missing tables
+    are created with column types derived from the DataFrame dtypes.
+    
+    In 'upsert' mode the table is kept, columns missing from it are added
+    and rows are written with INSERT ... ON CONFLICT on the key columns.
+    Existing rows are only rewritten when one of their values changed.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to load
+        table_name (str): Name of the table to create/update
+        db_uri (str): SQLite database URI
+        if_exists (str): How to behave if the table exists ('fail', 'replace', 'append' or 'upsert')
+        index (bool): Write DataFrame index as a column
+        chunk_size (int): Rows per executemany batch
+        cache_size_kb (int): SQLite page cache size in KiB
+        key_columns (list, optional): Natural key columns, required for 'upsert'
+        
+    Returns:
+        bool: True if successful
+    """
+    if index:
+        df = df.reset_index()
+    
+    if if_exists == 'upsert':
+        if not key_columns:
+            raise ValueError("Upsert requires key columns")
+        
+        missing_keys = [col for col in key_columns if col not in df.columns]
+        if missing_keys:
+            raise ValueError(f"Key columns not found in DataFrame: {missing_keys}")
+        
+        # The unique index treats NULLs as distinct, so these rows would be
+        # inserted again on every run
+        null_keys = df[key_columns].isna().any(axis=1)
+        if null_keys.any():
+            logger.warning(f"Skipping {null_keys.sum()} rows with a missing key ({', '.join(key_columns)}) "
+                           f"in table '{table_name}'")
+            df = df[~null_keys]
+    
+    conn = connect_for_bulk_load(db_uri, cache_size_kb=cache_size_kb)
+    
+    try:
+        conn.execute("BEGIN")
+        
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+        ).fetchone() is not None
+        
+        if exists and if_exists == 'fail':
+            raise ValueError(f"Table '{table_name}' already exists")
+        
+        if exists and if_exists == 'replace':
+            conn.execute(f'DROP TABLE "{table_name}"')
+            exists = False
+        
+        if not exists:
+            conn.execute(pd.io.sql.get_schema(df, table_name, con=conn))
+        
+        # Insert all rows in batches
+        columns = ', '.join(f'"{col}"' for col in df.columns)
+        placeholders = ', '.join('?' for _ in df.columns)
+        insert_sql = f'INSERT INTO "{table_name}" ({columns}) VALUES ({placeholders})'
+        
+        if if_exists == 'upsert':
+            prepare_upsert_table(conn, df, table_name, key_columns)
+            insert_sql += build_upsert_clause(df.columns, key_columns, table_name)
+        
+        changes_before = conn.total_changes
+        for rows in iter_sqlite_rows(df, chunk_size):
+            conn.executemany(insert_sql, rows)
+        changed_rows = conn.total_changes - changes_before
+        
+        conn.execute("COMMIT")
+        
+        # Verify the data was loaded by counting rows
+        row_count = conn.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+    
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    
+    finally:
+        conn.close()
+    
+    if if_exists == 'upsert':
+        logger.info(f"Successfully upserted {len(df)} rows to table '{table_name}' "
+                    f"({changed_rows} inserted or changed, {row_count} rows in table)")
+    else:
+        logger.info(f"Successfully bulk loaded {row_count} rows to table '{table_name}'")
+    return True
+
+def prepare_upsert_table(conn, df, table_name, key_columns):
+    """
+    Prepare an existing table for upserts from a DataFrame.
+    
+    Adds the DataFrame columns the table does not have yet and a unique
+    index on the key columns, which INSERT ... ON CONFLICT requires. Tables
+    written by earlier replace-mode runs can hold duplicate keys, which
+    would prevent creating the index; only the last loaded row of each key
+    is kept.
+    
+    Args:
+        conn (sqlite3.Connection): Open database connection
+        df (pandas.DataFrame): DataFrame that will be upserted
+        table_name (str): Name of the table
+        key_columns (list): Natural key columns
+    """
+    table_columns = {row[1] for row in conn.execute(f'PRAGMA table_info("{table_name}")')}
+    
+    for col in df.columns:
+        if col not in table_columns:
+            conn.execute(f'ALTER TABLE "{table_name}" ADD COLUMN "{col}" {_sqlite_type(df[col])}')
+            logger.info(f"Added column '{col}' to table '{table_name}'")
+    
+    index_name = f"ux_{table_name}_{'_'.join(key_columns)}"
+    key_list = ', '.join(f'"{col}"' for col in key_columns)
+    
+    index_exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (index_name,)
+    ).fetchone() is not None
+    if index_exists:
+        return
+    
+    # Rows with a NULL key never conflict, so they are left alone
+    not_null = ' AND '.join(f'"{col}" IS NOT NULL' for col in key_columns)
+    removed = conn.execute(
+        f'DELETE FROM "{table_name}" WHERE {not_null} AND rowid NOT IN '
+        f'(SELECT MAX(rowid) FROM "{table_name}" GROUP BY {key_list})'
+    ).rowcount
+    if removed:
+        logger.warning(f"Removed {removed} rows with duplicate keys ({', '.join(key_columns)}) from table "
+                       f"'{table_name}' before adding its unique key index")
+    
+    conn.execute(f'CREATE UNIQUE INDEX "{index_name}" ON "{table_name}" ({key_list})')
+
+def build_upsert_clause(columns, key_columns, table_name):
+    """
+    Build the ON CONFLICT clause of an upsert statement.
+    
+    The update only fires for rows where at least one value differs, so
+    unchanged rows are not rewritten.
+    
+    Args:
+        columns (list): Columns being inserted
+        key_columns (list): Natural key columns
+        table_name (str): Name of the table
+        
+    Returns:
+        str: ON CONFLICT clause to append to an INSERT statement
+    """
+    key_list = ', '.join(f'"{col}"' for col in key_columns)
+    value_columns = [col for col in columns if col not in key_columns]
+    
+    if not value_columns:
+        return f" ON CONFLICT ({key_list}) DO NOTHING"
+    
+    assignments = ', '.join(f'"{col}" = excluded."{col}"' for col in value_columns)
+    changed = ' OR '.join(f'"{table_name}"."{col}" IS NOT excluded."{col}"' for col in value_columns)
+    return f" ON CONFLICT ({key_list}) DO UPDATE SET {assignments} WHERE {changed}"
+
+def connect_for_bulk_load(db_uri, cache_size_kb=65536):
+    """
+    Open a sqlite3 connection tuned for bulk writes.
+    
+    The connection manages transactions explicitly (autocommit mode), uses
+    WAL journaling with synchronous=NORMAL and a larger page cache.
+    
+    Args:
+        db_uri (str): SQLite database URI
+        cache_size_kb (int): SQLite page cache size in KiB
+        
+    Returns:
+        sqlite3.Connection: Open database connection
+    """
+    # Extract database path from URI
+    db_path = db_uri.replace('sqlite:///', '')
+    
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    for pragma, value in SQLITE_PRAGMAS.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    
+    # Negative cache sizes are in KiB rather than pages
+    conn.execute(f"PRAGMA cache_size = -{int(cache_size_kb)}")
+    return conn
+
+def iter_sqlite_rows(df, chunk_size):
+    """
+    Convert a DataFrame to batches of row tuples that sqlite3 can bind.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to convert
+        chunk_size (int): Maximum number of rows per batch
+        
+    Yields:
+        list: List of row tuples with Python values and None for missing values
+    """
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        columns = [_to_sqlite_values(chunk[col]) for col in chunk.columns]
+        yield list(zip(*columns))
+
+def _sqlite_type(series):
+    """Map the dtype of a Series to a SQLite column type."""
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(series):
+        return "REAL"
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return "TIMESTAMP"
+    return "TEXT"
+
+def _to_sqlite_values(series):
+    """Convert a Series to a list of Python values supported by sqlite3."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        # Store timestamps as text, like DataFrame.to_sql does
+        values = series.dt.strftime('%Y-%m-%d %H:%M:%S.%f').to_numpy(dtype=object)
+    else:
+        values = series.to_numpy(dtype=object)
+    
+    values[series.isna().to_numpy()] = None
+    return values.tolist()
+
 def create_database_schema(db_uri, tables_info):
     """
     Create database schema for COVID-19 data.
@@ -21,15 +21,57 @@ def parse_arguments():
     parser = argparse.ArgumentParser(description='COVID-19 ETL Pipeline')
     
     parser.add_argument('--csv_path', type=str, default=None,
-                        help='Path to CSV file with case data')
+                        help='Path to CSV, Parquet or Arrow IPC file with case data')
     parser.add_argument('--json_path', type=str, default=None,
-                        help='Path to JSON file with hospital resource data')
+                        help='Path to JSON, Parquet or Arrow IPC file with hospital resource data')
     parser.add_argument('--api_url', type=str, default=None,
                         help='URL for API endpoint with vaccination data')
     parser.add_argument('--html_url', type=str, default=None,
                         help='URL for web page with COVID-19 data')
     parser.add_argument('--export_csv', type=bool, default=False,
                         help='Export results to CSV files')
+    parser.add_argument('--export_parquet', action='store_true', default=None,
+                        help='Export results to Parquet datasets partitioned by date and region')
+    parser.add_argument('--chunksize', type=int, nargs='?', default=None, const=config.CSV_CHUNK_SIZE,
+                        help='Stream the CSV and JSON files in chunks of this many rows (default: load the whole files)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of pipeline tasks to run concurrently (default: 1)')
+    parser.add_argument('--processes', action='store_true', default=None,
+                        help='Transform and validate each dataset in its own worker process')
+    parser.add_argument('--partitions', type=int, default=None,
+                        help='Transform large datasets in this many row partitions in parallel worker processes')
+    parser.add_argument('--validation_mode', choices=['exact', 'compiled', 'sampled'], default=None,
+                        help='Evaluate each expectation on its own, on shared column statistics or on a sample')
+    parser.add_argument('--validation_sample_fraction', type=float, default=None,
+                        help='Fraction of the rows validated in sampled mode')
+    parser.add_argument('--validation_sample_size', type=int, default=None,
+                        help='Number of rows validated in sampled mode (default: 1000000)')
+    parser.add_argument('--start_date', type=str, default=None,
+                        help='First date (YYYY-MM-DD) read from Parquet and Arrow IPC inputs')
+    parser.add_argument('--end_date', type=str, default=None,
+                        help='Last date (YYYY-MM-DD) read from Parquet and Arrow IPC inputs')
+    parser.add_argument('--intermediate_dir', type=str, nargs='?', default=None,
+                        const=config.DEFAULT_INTERMEDIATE_DIR,
+                        help='Hand data between stages and worker processes through memory-mapped Arrow IPC '
+                             'files in this directory (default: output/intermediate if given without a value)')
+    parser.add_argument('--copy_free', action='store_true', default=None,
+                        help='Transform data in place instead of copying it at every step')
+    parser.add_argument('--fast_load', action='store_true', default=None,
+                        help='Bulk load SQLite tables with batched inserts in a single transaction')
+    parser.add_argument('--incremental', action='store_true', default=None,
+                        help='Upsert rows on their natural key instead of replacing the tables')
+    parser.add_argument('--api_page_size', type=int, default=None,
+                        help='Fetch all API records in concurrent pages of this size')
+    parser.add_argument('--http_cache', action='store_true', default=None,
+                        help='Reuse cached API and web data while the server reports it unchanged')
+    parser.add_argument('--skip_unchanged', action='store_true', default=None,
+                        help='Skip CSV and JSON inputs that have not changed since they were last loaded')
+    parser.add_argument('--stage_cache', action='store_true', default=None,
+                        help='Reuse cached extraction and transformation outputs whose inputs and code are unchanged')
+    parser.add_argument('--checkpoint', action='store_true', default=None,
+                        help='Save the result of every completed task so that a failed run can be resumed')
+    parser.add_argument('--resume', action='store_true',
+                        help='Resume a failed run with the same arguments from its first incomplete task')
     parser.add_argument('--schedule', type=int, default=0,
                         help='Run pipeline on schedule with specified interval in minutes (0 for one-time run)')
     
@@ -66,7 +108,27 @@ def main():
                 json_path=args.json_path,
                 api_url=args.api_url,
                 html_url=args.html_url,
-                export_csv=args.export_csv
+                export_csv=args.export_csv,
+                export_parquet=args.export_parquet,
+                chunksize=args.chunksize,
+                max_workers=args.workers,
+                processes=args.processes,
+                partitions=args.partitions,
+                validation_mode=args.validation_mode,
+                validation_sample_fraction=args.validation_sample_fraction,
+                validation_sample_size=args.validation_sample_size,
+                start_date=args.start_date,
+                end_date=args.end_date,
+                intermediate_dir=args.intermediate_dir,
+                copy_free=args.copy_free,
+                fast_load=args.fast_load,
+                incremental=args.incremental,
+                api_page_size=args.api_page_size,
+                http_cache=args.http_cache,
+                skip_unchanged=args.skip_unchanged,
+                stage_cache=args.stage_cache,
+                checkpoint=args.checkpoint,
+                resume=args.resume
             )
         else:
             # Run once
@@ -76,7 +138,27 @@ def main():
                 json_path=args.json_path,
                 api_url=args.api_url,
                 html_url=args.html_url,
-                export_csv=args.export_csv
+                export_csv=args.export_csv,
+                export_parquet=args.export_parquet,
+                chunksize=args.chunksize,
+                max_workers=args.workers,
+                processes=args.processes,
+                partitions=args.partitions,
+                validation_mode=args.validation_mode,
+                validation_sample_fraction=args.validation_sample_fraction,
+                validation_sample_size=args.validation_sample_size,
+                start_date=args.start_date,
+                end_date=args.end_date,
+                intermediate_dir=args.intermediate_dir,
+                copy_free=args.copy_free,
+                fast_load=args.fast_load,
+                incremental=args.incremental,
+                api_page_size=args.api_page_size,
+                http_cache=args.http_cache,
+                skip_unchanged=args.skip_unchanged,
+                stage_cache=args.stage_cache,
+                checkpoint=args.checkpoint,
+                resume=args.resume
             )
             
             logger.info("Pipeline run complete")
@@ -5,24 +5,40 @@ import os
 import logging
 import time
 import pandas as pd
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime, timedelta
 
 # Import project modules
 import config
-from extractors.csv_extractor import extract_from_csv
-from extractors.json_extractor import extract_from_json
-from extractors.api_extractor import extract_from_api
+from extractors.csv_extractor import extract_from_csv, extract_csv_chunks
+from extractors.json_extractor import extract_from_json, extract_json_chunks
+from extractors.columnar_extractor import is_columnar, extract_from_columnar, extract_columnar_chunks
+from extractors.api_extractor import extract_from_api, is_socrata
 from extractors.web_scraper import extract_from_web
+from extractors.http_client import configure_http
 from transformers.date_transformer import standardize_dates
 from transformers.location_transformer import normalize_locations
 from transformers.missing_value_handler import handle_missing_values
 from transformers.calculator import create_calculated_fields
-from validators.data_validator import validate_covid_data
+from validators.data_validator import validate_covid_data, validate_covid_stream, StreamingValidator
 from loaders.sql_loader import load_to_sqlite, create_database_schema
 from loaders.csv_exporter import export_to_csv
+from loaders.parquet_exporter import export_to_parquet
+from loaders.metadata import get_watermark, set_watermark, get_fingerprint, set_fingerprint
+from utils import file_fingerprint
+from stage_cache import StageCache
+from checkpoint import Checkpoint, run_key
+from intermediate import IntermediateStore, StoredFrame
+from worker_pool import process_pool
+from parallel import transform_in_process, apply_partitioned
 
 logger = logging.getLogger(__name__)
 
+# Transformers that treat every row independently, so they can be applied
+# to row partitions of a dataset
+ROW_WISE_TRANSFORMERS = (standardize_dates, normalize_locations, create_calculated_fields)
+
 class Task:
     """Simple class to represent an ETL task."""
     
@@ -40,17 +56,39 @@ class Task:
         self.kwargs = kwargs
         self.result = None
         self.success = None
+        self.skipped = False
+        self.cached = False
+        self.restored = False
         self.start_time = None
         self.end_time = None
         self.duration = None
     
-    def run(self):
-        """Run the task and capture execution metrics."""
+    def run(self, cache=None):
+        """
+        Run the task and capture execution metrics.
+        
+        Args:
+            cache (StageCache, optional): Cache to reuse the result from, or to store it in
+            
+        Returns:
+            object: The result of the task
+        """
         logger.info(f"Starting task: {self.name}")
         self.start_time = time.time()
         
         try:
-            self.result = self.function(**self.kwargs)
+            key = cache.key(self.function, self.kwargs) if cache is not None else None
+            cached_result = cache.get(key) if key is not None else None
+            
+            if cached_result is not None:
+                self.result = cached_result
+                self.cached = True
+                logger.info(f"Reused cached result: {self.name}")
+            else:
+                self.result = self.function(**self.kwargs)
+                if key is not None:
+                    cache.put(key, self.result)
+            
             self.success = True
             logger.info(f"Task completed successfully: {self.name}")
         except Exception as e:
@@ -64,22 +102,469 @@ class Task:
         
         return self.result
 
-def run_pipeline(csv_path=None, json_path=None, api_url=None, html_url=None, export_csv=False):
+class TaskGraph:
+    """
+    Dependency graph of tasks that runs every ready task on a worker pool.
+    
+    Tasks must be added after the tasks they depend on, so the insertion
+    order is always a valid execution order. With a single worker the
+    tasks run exactly in that order.
+    """
+    
+    def __init__(self, cache=None, checkpoint=None, intermediate=None):
+        """
+        Initialize an empty task graph.
+        
+        Args:
+            cache (StageCache, optional): Cache for the results of tasks added with cache=True
+            checkpoint (Checkpoint, optional): Checkpoint to restore completed tasks from
+                                               and to save every completed task to
+            intermediate (IntermediateStore, optional): Store to hand DataFrame results
+                                                        to later tasks through
+        """
+        self.tasks = {}
+        self.inputs = {}
+        self.dependencies = {}
+        self.conditions = {}
+        self.cached = set()
+        self.cache = cache
+        self.checkpoint = checkpoint
+        self.intermediate = intermediate
+    
+    def add(self, task, inputs=None, after=None, when=None, cache=False):
+        """
+        Add a task to the graph.
+        
+        Args:
+            task (Task): Task to add, its name must be unique within the graph
+            inputs (dict, optional): Mapping of function argument names to the names
+                                     of the upstream tasks whose results they receive
+            after (list, optional): Names of upstream tasks that must finish first
+                                    without passing their results, this task still
+                                    runs if they are skipped
+            when (callable, optional): Predicate called with the resolved inputs,
+                                       the task is skipped if it returns False
+            cache (bool, optional): Reuse the result from the graph's cache while the
+                                    task's code and arguments are unchanged. Only for
+                                    tasks without side effects.
+                                    
+        Returns:
+            Task: The added task
+        """
+        if task.name in self.tasks:
+            raise ValueError(f"Duplicate task name: {task.name}")
+        
+        inputs = dict(inputs or {})
+        dependencies = list(dict.fromkeys(list(inputs.values()) + list(after or [])))
+        
+        for dependency in dependencies:
+            if dependency not in self.tasks:
+                raise ValueError(f"Task '{task.name}' depends on unknown task '{dependency}'")
+        
+        self.tasks[task.name] = task
+        self.inputs[task.name] = inputs
+        self.dependencies[task.name] = dependencies
+        self.conditions[task.name] = when
+        if cache:
+            self.cached.add(task.name)
+        return task
+    
+    def run(self, max_workers=1):
+        """
+        Run all tasks, starting each one as soon as its dependencies finish.
+        
+        A task is skipped when the task of any of its inputs was skipped or
+        when its condition is not met. After a failure no new tasks are started, the
+        running ones are allowed to finish and the first error is raised.
+        
+        Tasks found in the checkpoint are not run again, their results are
+        restored instead.
+        
+        Args:
+            max_workers (int, optional): Maximum number of tasks to run at once
+            
+        Returns:
+            dict: Dictionary mapping task names to their results
+        """
+        logger.info(f"Running {len(self.tasks)} tasks with {max_workers} workers")
+        start_time = time.time()
+        
+        pending = list(self.tasks)
+        running = {}
+        finished = set()
+        failure = None
+        restored = self._restore()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                # Start ready tasks in insertion order while workers are free
+                if failure is None:
+                    for name in list(pending):
+                        if len(running) >= max_workers:
+                            break
+                        
+                        if not all(dependency in finished for dependency in self.dependencies[name]):
+                            continue
+                        
+                        pending.remove(name)
+                        task = self.tasks[name]
+                        
+                        if name in restored:
+                            task.result = restored[name]
+                            task.success = True
+                            task.restored = True
+                            finished.add(name)
+                            logger.info(f"Restored task from checkpoint: {name}")
+                            continue
+                        
+                        if self._should_skip(name):
+                            task.skipped = True
+                            finished.add(name)
+                            logger.info(f"Skipping task: {name}")
+                            continue
+                        
+                        running[executor.submit(self._run_task, name)] = name
+                
+                if not running:
+                    break
+                
+                # Wait for at least one running task to finish
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                    except Exception as e:
+                        if failure is None:
+                            failure = e
+                    finished.add(name)
+        
+        if failure is not None:
+            raise failure
+        
+        path, path_duration = self.critical_path()
+        logger.info(f"Task graph completed in {time.time() - start_time:.2f} seconds")
+        if path:
+            logger.info(f"Critical path: {' -> '.join(path)} ({path_duration:.2f} seconds)")
+        
+        return {name: task.result for name, task in self.tasks.items()}
+    
+    def _run_task(self, name):
+        """Run a task on a worker, then checkpoint its result."""
+        task = self.tasks[name]
+        result = task.run(self.cache if name in self.cached else None)
+        saved = result
+        
+        # Later tasks read DataFrames from the memory-mapped file, which the
+        # checkpoint only references, so the copy in memory can be released
+        if self.intermediate is not None and isinstance(result, pd.DataFrame):
+            stored = self.intermediate.put(name, result)
+            stored_result = self.intermediate.get(stored) if stored is not None else None
+            if stored_result is not None:
+                task.result = result = stored_result
+                saved = stored
+        
+        if self.checkpoint is not None:
+            self.checkpoint.save(name, saved)
+        
+        return result
+    
+    def _restore(self):
+        """Load the results of the checkpointed tasks, opening those kept in the intermediate store."""
+        if self.checkpoint is None:
+            return {}
+        
+        restored = self.checkpoint.load()
+        for name, result in list(restored.items()):
+            if not isinstance(result, StoredFrame):
+                continue
+            
+            df = self.intermediate.get(result) if self.intermediate is not None else None
+            if df is None:
+                logger.warning(f"Ignoring checkpoint of task '{name}', its intermediate file is gone")
+                del restored[name]
+            else:
+                restored[name] = df
+        
+        return restored
+    
+    def _should_skip(self, name):
+        """Resolve the inputs of a task and decide whether it should be skipped."""
+        if any(self.tasks[source].skipped for source in self.inputs[name].values()):
+            return True
+        
+        resolved = {arg: self.tasks[source].result for arg, source in self.inputs[name].items()}
+        condition = self.conditions[name]
+        if condition is not None and not condition(**resolved):
+            return True
+        
+        self.tasks[name].kwargs.update(resolved)
+        return False
+    
+    def critical_path(self):
+        """
+        Find the longest chain of dependent tasks by measured duration.
+        
+        Returns:
+            tuple: List of task names on the critical path and its total duration in seconds
+        """
+        costs = {}
+        previous = {}
+        
+        # Insertion order is a topological order, so upstream costs are known
+        for name, task in self.tasks.items():
+            upstream = max(self.dependencies[name], key=lambda dependency: costs[dependency], default=None)
+            costs[name] = (task.duration or 0) + (costs[upstream] if upstream else 0)
+            previous[name] = upstream
+        
+        if not costs:
+            return [], 0
+        
+        name = max(costs, key=costs.get)
+        total = costs[name]
+        path = []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+        
+        return path[::-1], total
+
+def process_chunks(chunks, label, table_name, calculated_fields=True, export_path=None, load_options=None,
+                   parquet_dir=None):
+    """
+    Transform, validate and load a dataset one chunk at a time.
+    
+    The first chunk replaces the target table and every later chunk is
+    appended to it, so only a single chunk is held in memory at once. If
+    load_options ask for an upsert, every chunk is upserted instead. The
+    chunks are validated together: a StreamingValidator accumulates their
+    column statistics, giving the verdict validate_covid_data would give on
+    the whole dataset. A chunk that cannot be loaded raises an error, so a
+    resumed run streams the dataset again.
+    
+    Args:
+        chunks (iterable): Iterable of pandas.DataFrame chunks
+        label (str): Dataset label used in log messages
+        table_name (str): Name of the SQLite table to load
+        calculated_fields (bool, optional): Whether to create calculated fields
+        export_path (str, optional): Path of a CSV file to export the chunks to
+        load_options (dict, optional): Extra arguments for load_to_sqlite
+        parquet_dir (str, optional): Directory of a Parquet dataset to export the chunks to
+        
+    Returns:
+        dict: Summary with chunk and row counts and the validation outcome
+    """
+    summary = {'chunks': 0, 'rows': 0, 'valid': True}
+    load_options = dict(load_options or {})
+    upsert = load_options.pop('if_exists', None) == 'upsert'
+    validator = StreamingValidator()
+    
+    for chunk in chunks:
+        summary['chunks'] += 1
+        chunk_number = summary['chunks']
+        logger.info(f"Processing {label} chunk {chunk_number} ({len(chunk)} rows)")
+        
+        # Transform chunk in place, nothing else holds a reference to it
+        chunk = standardize_dates(chunk, date_columns=config.DATE_FIELDS, copy=False)
+        chunk = normalize_locations(chunk, location_columns=config.LOCATION_FIELDS, copy=False)
+        chunk = handle_missing_values(chunk, copy=False)
+        if calculated_fields:
+            chunk = create_calculated_fields(chunk, copy=False)
+        
+        # Accumulate the statistics of the chunk for validation
+        validator.update(chunk)
+        
+        # Load chunk, replacing the table only for the first one
+        if upsert:
+            if_exists = 'upsert'
+        else:
+            if_exists = 'replace' if chunk_number == 1 else 'append'
+        load_table(chunk, table_name=table_name, db_uri=config.DB_URI, if_exists=if_exists, **load_options)
+        
+        # Export chunk, writing the header only for the first one
+        if export_path:
+            export_to_csv(chunk, file_path=export_path, append=chunk_number > 1)
+        
+        # Export chunk, replacing the dataset only for the first one
+        if parquet_dir:
+            export_to_parquet(chunk, dataset_dir=parquet_dir, partition_cols=config.PARQUET_PARTITION_COLUMNS,
+                              compression=config.PARQUET_COMPRESSION, append=chunk_number > 1)
+        
+        summary['rows'] += len(chunk)
+    
+    # Validate all chunks together
+    summary['valid'] = validate_covid_stream(validator)
+    
+    logger.info(f"Processed {summary['rows']} {label} rows in {summary['chunks']} chunks")
+    return summary
+
+def load_table(df, **load_options):
+    """
+    Load a DataFrame to SQLite, raising an error if the load fails.
+    
+    load_to_sqlite reports a failure by returning False. Raising instead
+    fails the load task, so it is not checkpointed and a resumed run loads
+    the data again.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to load
+        **load_options: Arguments for load_to_sqlite, such as table_name and db_uri
+        
+    Returns:
+        bool: True once the data is loaded
+    """
+    if not load_to_sqlite(df, **load_options):
+        raise RuntimeError(f"Loading table '{load_options.get('table_name')}' to SQLite failed")
+    
+    return True
+
+def update_watermark(df, loaded, source, db_uri):
+    """
+    Store the watermark reported by an extractor once its data is loaded.
+    
+    Args:
+        df (pandas.DataFrame): Extracted DataFrame with the watermark in its attrs
+        loaded (bool): Whether the data was loaded successfully
+        source (str): Name or URL of the data source
+        db_uri (str): SQLite database URI
+        
+    Returns:
+        bool: True if a new watermark was stored, False otherwise
+    """
+    watermark = df.attrs.get('watermark')
+    
+    if not loaded or watermark is None:
+        logger.info(f"Keeping the previous watermark for '{source}'")
+        return False
+    
+    return set_watermark(db_uri, source, watermark)
+
+def check_fingerprint(file_path, source, db_uri):
+    """
+    Compare the fingerprint of an input file with the one last loaded.
+    
+    Args:
+        file_path (str): Path to the input file
+        source (str): Name of the data source, such as the table the file is loaded into
+        db_uri (str): SQLite database URI
+        
+    Returns:
+        dict: The current 'fingerprint' of the file (None if it cannot be read) and
+              whether it 'changed' since the last successful load
+    """
+    previous = get_fingerprint(db_uri, source)
+    
+    try:
+        fingerprint = file_fingerprint(file_path, previous=previous)
+    except OSError as e:
+        logger.warning(f"Cannot fingerprint {file_path}: {e}")
+        return {'fingerprint': None, 'changed': True}
+    
+    changed = previous is None or (previous['size'], previous['hash']) != (fingerprint['size'], fingerprint['hash'])
+    if changed:
+        logger.info(f"Input {file_path} changed since the last load of '{source}'")
+    else:
+        logger.info(f"Input {file_path} unchanged since the last load of '{source}', skipping it")
+        
+        # Only the path or modification time changed, remember them so the
+        # next check does not need to hash the file again
+        if fingerprint != previous:
+            set_fingerprint(db_uri, source, fingerprint)
+    
+    return {'fingerprint': fingerprint, 'changed': changed}
+
+def store_fingerprint(check, loaded, source, db_uri):
+    """
+    Store the fingerprint of an input file once its data is loaded.
+    
+    Args:
+        check (dict): Result of check_fingerprint for the file
+        loaded (bool or dict): Load result, or the process_chunks summary
+        source (str): Name of the data source, such as the table the file is loaded into
+        db_uri (str): SQLite database URI
+        
+    Returns:
+        bool: True if the fingerprint was stored, False otherwise
+    """
+    if not loaded or check['fingerprint'] is None:
+        logger.info(f"Keeping the previous fingerprint for '{source}'")
+        return False
+    
+    return set_fingerprint(db_uri, source, check['fingerprint'])
+
+def run_pipeline(csv_path=None, json_path=None, api_url=None, html_url=None, export_csv=False, export_parquet=None,
+                 chunksize=None, max_workers=None, copy_free=None, fast_load=None,
+                 incremental=None, api_page_size=None, http_cache=None, skip_unchanged=None,
+                 stage_cache=None, checkpoint=None, resume=False, processes=None, partitions=None,
+                 validation_mode=None, validation_sample_fraction=None, validation_sample_size=None,
+                 start_date=None, end_date=None, intermediate_dir=None):
     """
     Run the complete ETL pipeline.
     
+    The pipeline is built as a TaskGraph, so the cases, hospitals and
+    vaccinations branches only wait on each other where they share a step.
+    
     Args:
-        csv_path (str, optional): Path to CSV file
-        json_path (str, optional): Path to JSON file
+        csv_path (str, optional): Path to CSV file, or a Parquet or Arrow IPC file
+        json_path (str, optional): Path to JSON file, or a Parquet or Arrow IPC file
         api_url (str, optional): URL for API endpoint
         html_url (str, optional): URL for web page
         export_csv (bool, optional): Whether to export results to CSV
-        
+        export_parquet (bool, optional): Whether to export results to Parquet datasets
+                                         partitioned by date and region
+        chunksize (int, optional): Stream the CSV and JSON data in chunks of this many
+                                   rows instead of loading the whole files into memory
+        max_workers (int, optional): Number of tasks to run concurrently
+        copy_free (bool, optional): Copy the extracted data once for the first
+                                    transformer and let the later ones modify it
+                                    in place, instead of copying it at every step
+        fast_load (bool, optional): Bulk load SQLite tables with sqlite3 batches
+                                    instead of DataFrame.to_sql
+        incremental (bool, optional): Upsert rows on each table's natural key
+                                      instead of replacing the tables, and only
+                                      extract API records from the stored
+                                      watermark on
+        api_page_size (int, optional): Page through the API with this many records
+                                       per page, fetching pages concurrently
+        http_cache (bool, optional): Cache API and web responses on disk and reuse
+                                     the extracted data while the server answers
+                                     304 Not Modified
+        skip_unchanged (bool, optional): Skip the transform, validate and load steps
+                                         of the CSV and JSON inputs whose content has
+                                         not changed since they were last loaded
+        stage_cache (bool, optional): Reuse the cached outputs of the file extraction
+                                      and transformation steps whose inputs and code
+                                      have not changed
+        checkpoint (bool, optional): Save the result of every completed task, so that
+                                     a failed run can be resumed
+        resume (bool, optional): Resume a failed run with the same arguments from
+                                 its checkpoint, only running the incomplete tasks
+        processes (bool, optional): Transform and validate each dataset in its own
+                                    worker process instead of a thread
+        partitions (int, optional): Split large datasets into this many row partitions
+                                    and run the row-wise transformers on them in
+                                    worker processes (ignored with processes)
+        validation_mode (str, optional): Validation mode, "exact", "compiled" to compute
+                                         each column's statistics once for all of its
+                                         expectations or "sampled" to validate a sample
+                                         of the rows with confidence bounds
+        validation_sample_fraction (float, optional): Fraction of the rows validated in
+                                                      "sampled" mode
+        validation_sample_size (int, optional): Number of rows validated in "sampled" mode,
+                                                used if no fraction is given
+        start_date (str, optional): First date read from Parquet and Arrow IPC inputs
+        end_date (str, optional): Last date read from Parquet and Arrow IPC inputs
+        intermediate_dir (str, optional): Directory to hand data between the stages and
+                                          worker processes through as memory-mapped
+                                          Arrow IPC files, instead of keeping it in memory
+                                          
     Returns:
         dict: Dictionary with results of each stage
     """
     logger.info("Starting COVID-19 ETL pipeline")
-    results = {}
+    
+    # Closes the process pool, if one is started
+    resources = ExitStack()
     
     try:
         # Set default values if not provided
@@ -87,63 +572,229 @@ def run_pipeline(csv_path=None, json_path=None, api_url=None, html_url=None, exp
         json_path = json_path or config.DEFAULT_JSON_PATH
         api_url = api_url or config.DEFAULT_API_URL
         html_url = html_url or config.DEFAULT_HTML_URL
+        max_workers = max_workers or config.MAX_WORKERS
+        export_parquet = config.EXPORT_PARQUET if export_parquet is None else export_parquet
+        copy_free = config.COPY_FREE_TRANSFORMS if copy_free is None else copy_free
+        fast_load = config.SQLITE_FAST_LOAD if fast_load is None else fast_load
+        incremental = config.INCREMENTAL_LOAD if incremental is None else incremental
+        api_page_size = api_page_size or config.API_PAGE_SIZE
+        http_cache = config.HTTP_CACHE if http_cache is None else http_cache
+        http_cache_dir = config.HTTP_CACHE_DIR if http_cache else None
+        skip_unchanged = config.SKIP_UNCHANGED_INPUTS if skip_unchanged is None else skip_unchanged
+        stage_cache = config.STAGE_CACHE if stage_cache is None else stage_cache
+        checkpoint = config.CHECKPOINT_TASKS if checkpoint is None else checkpoint
+        processes = config.PROCESS_BRANCHES if processes is None else processes
+        partitions = partitions or config.PARTITIONS
+        validation_mode = validation_mode or config.VALIDATION_MODE
+        validation_sample_fraction = validation_sample_fraction or config.VALIDATION_SAMPLE_FRACTION
+        validation_sample_size = validation_sample_size or config.VALIDATION_SAMPLE_SIZE
+        start_date = start_date or config.START_DATE
+        end_date = end_date or config.END_DATE
+        intermediate_dir = intermediate_dir or config.INTERMEDIATE_DIR
         
-        # Extract data
-        logger.info("Starting extraction phase")
+        # Share one pooled HTTP session between the API and web extractors,
+        # concurrent page requests each need their own connection
+        configure_http(pool_size=max(config.HTTP_POOL_SIZE, config.API_MAX_WORKERS),
+                       timeout=config.HTTP_TIMEOUT, retries=config.HTTP_RETRIES)
         
-        cases_df = Task("Extract CSV", extract_from_csv, file_path=csv_path).run()
-        results['extract_csv'] = cases_df
+        # Options shared by every SQLite load
+        load_options = {}
+        if fast_load:
+            load_options = {
+                'fast': True,
+                'chunk_size': config.SQLITE_CHUNK_SIZE,
+                'cache_size_kb': config.SQLITE_CACHE_SIZE_KB
+            }
         
-        hospitals_df = Task("Extract JSON", extract_from_json, file_path=json_path).run()
-        results['extract_json'] = hospitals_df
+        def table_load_options(table_name):
+            """Get the load_to_sqlite arguments for a table."""
+            if not incremental:
+                return load_options
+            key_columns = config.NATURAL_KEYS[table_name]
+            if table_name == config.VACCINATIONS_TABLE and is_socrata(api_url):
+                key_columns = config.SOCRATA_NATURAL_KEY
+            return dict(load_options, if_exists='upsert', key_columns=key_columns)
         
-        vaccinations_df = Task("Extract API", extract_from_api, api_url=api_url).run()
-        results['extract_api'] = vaccinations_df
+        # Arguments shared by every validation
+        validation_options = {'mode': validation_mode}
+        if validation_mode == "sampled":
+            validation_options.update({
+                'sample_fraction': validation_sample_fraction,
+                'sample_size': validation_sample_size
+            })
         
-        # Optional web scraping
-        if html_url:
-            web_df = Task("Extract Web", extract_from_web, url=html_url).run()
-            results['extract_web'] = web_df
+        cache = None
+        if stage_cache:
+            cache = StageCache(config.STAGE_CACHE_DIR, max_bytes=config.STAGE_CACHE_MAX_MB * 2**20)
+        
+        # Checkpoints are kept per set of run arguments and input files
+        run_checkpoint = None
+        if checkpoint or resume:
+            run_checkpoint = Checkpoint(config.CHECKPOINT_DIR, run_key(
+                csv_path=csv_path, json_path=json_path, api_url=api_url, html_url=html_url,
+                export_csv=export_csv, export_parquet=export_parquet, chunksize=chunksize, copy_free=copy_free,
+                fast_load=fast_load, incremental=incremental, api_page_size=api_page_size, http_cache=http_cache,
+                skip_unchanged=skip_unchanged, stage_cache=stage_cache, start_date=start_date, end_date=end_date
+            ))
+            if not resume:
+                run_checkpoint.clear()
+        
+        # Stages that modify their input in place need writable copies of it
+        intermediate = None
+        if intermediate_dir:
+            intermediate = IntermediateStore(intermediate_dir, zero_copy=not copy_free)
+            if not resume:
+                intermediate.clear()
+            
+            # Files handed to worker processes go to the store's directory as well
+            intermediate_dir = intermediate.directory
+        
+        graph = TaskGraph(cache=cache, checkpoint=run_checkpoint, intermediate=intermediate)
         
-        # Transform data
-        logger.info("Starting transformation phase")
+        # Result keys mapped to the tasks that produce them
+        result_tasks = {}
         
-        # Transform cases data
-        if not cases_df.empty:
-            cases_df = Task("Standardize Dates (Cases)", standardize_dates, df=cases_df, date_columns=config.DATE_FIELDS).run()
-            cases_df = Task("Normalize Locations (Cases)", normalize_locations, df=cases_df, location_columns=config.LOCATION_FIELDS).run()
-            cases_df = Task("Handle Missing Values (Cases)", handle_missing_values, df=cases_df).run()
-            cases_df = Task("Create Calculated Fields (Cases)", create_calculated_fields, df=cases_df).run()
-            results['transform_cases'] = cases_df
+        # Fingerprint the input files, keyed on the table they are loaded into
+        fingerprint_tasks = {}
+        if skip_unchanged:
+            for label, file_path, table_name in [("Cases", csv_path, config.CASES_TABLE),
+                                                 ("Hospitals", json_path, config.HOSPITALS_TABLE)]:
+                name = f"Fingerprint {label}"
+                graph.add(Task(name, check_fingerprint, file_path=file_path, source=table_name, db_uri=config.DB_URI))
+                fingerprint_tasks[label] = name
         
-        # Transform hospitals data
-        if not hospitals_df.empty:
-            hospitals_df = Task("Standardize Dates (Hospitals)", standardize_dates, df=hospitals_df, date_columns=config.DATE_FIELDS).run()
-            hospitals_df = Task("Normalize Locations (Hospitals)", normalize_locations, df=hospitals_df, location_columns=config.LOCATION_FIELDS).run()
-            hospitals_df = Task("Handle Missing Values (Hospitals)", handle_missing_values, df=hospitals_df).run()
-            results['transform_hospitals'] = hospitals_df
+        def changed_input(label):
+            """Get the TaskGraph.add arguments that skip a dataset whose input file is unchanged."""
+            name = fingerprint_tasks.get(label)
+            if name is None:
+                return {}
+            return {'after': [name], 'when': lambda: graph.tasks[name].result['changed']}
         
-        # Transform vaccinations data
-        if not vaccinations_df.empty:
-            vaccinations_df = Task("Standardize Dates (Vaccinations)", standardize_dates, df=vaccinations_df, date_columns=config.DATE_FIELDS).run()
-            vaccinations_df = Task("Normalize Locations (Vaccinations)", normalize_locations, df=vaccinations_df, location_columns=config.LOCATION_FIELDS).run()
-            vaccinations_df = Task("Handle Missing Values (Vaccinations)", handle_missing_values, df=vaccinations_df).run()
-            results['transform_vaccinations'] = vaccinations_df
+        def columnar_options(table_name):
+            """Get the column projection and date range of a Parquet or Arrow IPC input."""
+            return {'columns': config.COLUMNAR_COLUMNS.get(table_name), 'start_date': start_date, 'end_date': end_date}
+        
+        def extract_task(name, file_path, extract, table_name):
+            """Create the extraction task of an input file, by its format."""
+            if is_columnar(file_path):
+                return Task(name, extract_from_columnar, file_path=file_path, **columnar_options(table_name))
+            return Task(name, extract, file_path=file_path)
+        
+        def extract_chunks(file_path, extract, table_name):
+            """Stream the chunks of an input file, by its format."""
+            if is_columnar(file_path):
+                return extract_columnar_chunks(file_path, chunksize=chunksize, **columnar_options(table_name))
+            return extract(file_path, chunksize=chunksize)
+        
+        # Extract data, unchanged inputs skip the rest of their branch
+        if chunksize:
+            # Cases and hospitals are streamed through the whole pipeline during the loading phase
+            logger.info(f"Streaming CSV and JSON data in chunks of {chunksize} rows")
+        else:
+            graph.add(extract_task("Extract CSV", csv_path, extract_from_csv, config.CASES_TABLE), cache=True,
+                      **changed_input("Cases"))
+            result_tasks['extract_csv'] = "Extract CSV"
+            
+            graph.add(extract_task("Extract JSON", json_path, extract_from_json, config.HOSPITALS_TABLE), cache=True,
+                      **changed_input("Hospitals"))
+            result_tasks['extract_json'] = "Extract JSON"
+        
+        api_options = {'cache_dir': http_cache_dir}
+        if api_page_size:
+            api_options.update({
+                'page_size': api_page_size,
+                'max_workers': config.API_MAX_WORKERS,
+                'max_records': config.API_MAX_RECORDS
+            })
+        
+        if incremental:
+            # Only request the records added since the last loaded watermark
+            graph.add(Task("Read API Watermark", get_watermark, db_uri=config.DB_URI, source=api_url))
+            graph.add(Task("Extract API", extract_from_api, api_url=api_url, **api_options),
+                      inputs={'since': "Read API Watermark"})
+        else:
+            graph.add(Task("Extract API", extract_from_api, api_url=api_url, **api_options))
+        result_tasks['extract_api'] = "Extract API"
+        
+        # Optional web scraping
+        if html_url:
+            graph.add(Task("Extract Web", extract_from_web, url=html_url, cache_dir=http_cache_dir))
+            result_tasks['extract_web'] = "Extract Web"
         
-        # Validate data
-        logger.info("Starting validation phase")
+        # Datasets as (label, extraction task, result key, table name, export file)
+        datasets = [
+            ("Cases", "Extract CSV", 'transform_cases', config.CASES_TABLE, "covid_cases.csv"),
+            ("Hospitals", "Extract JSON", 'transform_hospitals', config.HOSPITALS_TABLE, "hospital_resources.csv"),
+            ("Vaccinations", "Extract API", 'transform_vaccinations', config.VACCINATIONS_TABLE, "vaccinations.csv")
+        ]
+        datasets = [dataset for dataset in datasets if dataset[1] in graph.tasks]
         
-        if not cases_df.empty:
-            Task("Validate Cases", validate_covid_data, df=cases_df).run()
+        # Each dataset branch gets its own worker process and a thread waiting on it
+        executor = None
+        if processes and datasets:
+            executor = resources.enter_context(process_pool(max_workers=len(datasets)))
+            max_workers = max(max_workers, len(datasets))
         
-        if not hospitals_df.empty:
-            Task("Validate Hospitals", validate_covid_data, df=hospitals_df).run()
+        # Row-wise transformers can be split across worker processes
+        partition_executor = None
+        if not processes and partitions > 1 and datasets:
+            partition_executor = resources.enter_context(process_pool(max_workers=partitions))
         
-        if not vaccinations_df.empty:
-            Task("Validate Vaccinations", validate_covid_data, df=vaccinations_df).run()
+        # Transform data, skipping datasets whose extraction returned no rows
+        transformed = {}
+        validated = {}
+        for label, source, result_key, _, _ in datasets:
+            steps = [
+                ("Standardize Dates", standardize_dates, {'date_columns': config.DATE_FIELDS}),
+                ("Normalize Locations", normalize_locations, {'location_columns': config.LOCATION_FIELDS}),
+                ("Handle Missing Values", handle_missing_values, {})
+            ]
+            if label == "Cases":
+                steps.append(("Create Calculated Fields", create_calculated_fields, {}))
+            
+            if executor is not None:
+                name = f"Transform and Validate {label}"
+                graph.add(
+                    Task(name, transform_in_process, executor=executor, label=label,
+                         steps=[(function, kwargs) for _, function, kwargs in steps],
+                         validate=validate_covid_data, validation_options=validation_options,
+                         intermediate_dir=intermediate_dir),
+                    inputs={'df': source}, when=lambda df: not df.empty
+                )
+                transformed[label] = validated[label] = result_tasks[result_key] = name
+                continue
+            
+            # Each step is the only consumer of the previous step's output, except
+            # for the extraction result, which run_pipeline also returns
+            if copy_free:
+                steps = steps[:1] + [
+                    (step_name, function, dict(kwargs, copy=False)) for step_name, function, kwargs in steps[1:]
+                ]
+            
+            previous = source
+            for step_name, function, kwargs in steps:
+                name = f"{step_name} ({label})"
+                when = (lambda df: not df.empty) if previous == source else None
+                
+                if partition_executor is not None and function in ROW_WISE_TRANSFORMERS:
+                    task = Task(name, apply_partitioned, func=function, partitions=partitions,
+                                executor=partition_executor, min_rows=config.PARTITION_MIN_ROWS,
+                                intermediate_dir=intermediate_dir, **kwargs)
+                else:
+                    task = Task(name, function, **kwargs)
+                
+                graph.add(task, inputs={'df': previous}, when=when, cache=True)
+                previous = name
+            
+            transformed[label] = previous
+            result_tasks[result_key] = previous
         
-        # Load data to SQLite
-        logger.info("Starting loading phase")
+        # Validate data, unless the worker processes already did
+        for label, _, _, _, _ in datasets:
+            if label not in validated:
+                validated[label] = f"Validate {label}"
+                graph.add(Task(validated[label], validate_covid_data, **validation_options),
+                          inputs={'df': transformed[label]})
         
         # Create database schema
         tables_info = {
@@ -182,33 +833,94 @@ def run_pipeline(csv_path=None, json_path=None, api_url=None, html_url=None, exp
             ]
         }
         
-        Task("Create Database Schema", create_database_schema, db_uri=config.DB_URI, tables_info=tables_info).run()
+        graph.add(Task("Create Database Schema", create_database_schema, db_uri=config.DB_URI, tables_info=tables_info))
+        
+        # Stream cases and hospitals through transformation, validation and loading
+        previous_load = "Create Database Schema"
+        if chunksize:
+            streams = [
+                ("Cases", extract_chunks(csv_path, extract_csv_chunks, config.CASES_TABLE), config.CASES_TABLE,
+                 "covid_cases.csv", True),
+                ("Hospitals", extract_chunks(json_path, extract_json_chunks, config.HOSPITALS_TABLE),
+                 config.HOSPITALS_TABLE, "hospital_resources.csv", False)
+            ]
+            for label, chunks, table_name, file_name, calculated_fields in streams:
+                export_path = None
+                if export_csv:
+                    export_path = os.path.join(config.DEFAULT_OUTPUT_DIR, file_name)
+                parquet_dir = os.path.join(config.PARQUET_DIR, table_name) if export_parquet else None
+                
+                # The streams load their chunks as they go, so they run one at a time
+                name = f"Stream {label}"
+                stream_options = changed_input(label)
+                stream_options['after'] = stream_options.get('after', []) + [previous_load]
+                graph.add(Task(
+                    name, process_chunks, chunks=chunks, label=label.lower(), table_name=table_name,
+                    calculated_fields=calculated_fields, export_path=export_path,
+                    load_options=table_load_options(table_name), parquet_dir=parquet_dir
+                ), **stream_options)
+                result_tasks[f"stream_{label.lower()}"] = name
+                previous_load = name
         
-        # Load each dataset to SQLite
-        if not cases_df.empty:
-            Task("Load Cases to SQLite", load_to_sqlite, df=cases_df, table_name=config.CASES_TABLE, db_uri=config.DB_URI).run()
+        # Load each dataset to SQLite once it has been validated. SQLite allows
+        # a single writer, so the loads are chained instead of run in parallel.
+        for label, _, _, table_name, _ in datasets:
+            name = f"Load {label} to SQLite"
+            graph.add(
+                Task(name, load_table, table_name=table_name, db_uri=config.DB_URI,
+                     **table_load_options(table_name)),
+                inputs={'df': transformed[label]},
+                after=[validated[label], previous_load]
+            )
+            previous_load = name
         
-        if not hospitals_df.empty:
-            Task("Load Hospitals to SQLite", load_to_sqlite, df=hospitals_df, table_name=config.HOSPITALS_TABLE, db_uri=config.DB_URI).run()
+        # Move the API watermark forward once the vaccinations are loaded
+        if incremental:
+            graph.add(
+                Task("Update API Watermark", update_watermark, source=api_url, db_uri=config.DB_URI),
+                inputs={'df': "Extract API", 'loaded': "Load Vaccinations to SQLite"}
+            )
         
-        if not vaccinations_df.empty:
-            Task("Load Vaccinations to SQLite", load_to_sqlite, df=vaccinations_df, table_name=config.VACCINATIONS_TABLE, db_uri=config.DB_URI).run()
+        # Remember the fingerprints of the input files once they are loaded
+        for label, name in fingerprint_tasks.items():
+            load_task = f"Stream {label}" if chunksize else f"Load {label} to SQLite"
+            source = graph.tasks[name].kwargs['source']
+            graph.add(
+                Task(f"Store {label} Fingerprint", store_fingerprint, source=source, db_uri=config.DB_URI),
+                inputs={'check': name, 'loaded': load_task}
+            )
         
         # Export to CSV if requested
         if export_csv:
-            logger.info("Exporting data to CSV")
-            
-            if not cases_df.empty:
-                export_path = os.path.join(config.DEFAULT_OUTPUT_DIR, "covid_cases.csv")
-                Task("Export Cases to CSV", export_to_csv, df=cases_df, file_path=export_path).run()
-            
-            if not hospitals_df.empty:
-                export_path = os.path.join(config.DEFAULT_OUTPUT_DIR, "hospital_resources.csv")
-                Task("Export Hospitals to CSV", export_to_csv, df=hospitals_df, file_path=export_path).run()
-            
-            if not vaccinations_df.empty:
-                export_path = os.path.join(config.DEFAULT_OUTPUT_DIR, "vaccinations.csv")
-                Task("Export Vaccinations to CSV", export_to_csv, df=vaccinations_df, file_path=export_path).run()
+            for label, _, _, _, file_name in datasets:
+                export_path = os.path.join(config.DEFAULT_OUTPUT_DIR, file_name)
+                graph.add(
+                    Task(f"Export {label} to CSV", export_to_csv, file_path=export_path),
+                    inputs={'df': transformed[label]}
+                )
+        
+        # Export to partitioned Parquet datasets if requested
+        if export_parquet:
+            for label, _, _, table_name, _ in datasets:
+                graph.add(
+                    Task(f"Export {label} to Parquet", export_to_parquet,
+                         dataset_dir=os.path.join(config.PARQUET_DIR, table_name),
+                         partition_cols=config.PARQUET_PARTITION_COLUMNS, compression=config.PARQUET_COMPRESSION),
+                    inputs={'df': transformed[label]}
+                )
+        
+        graph.run(max_workers=max_workers)
+        
+        # The run is complete, there is nothing left to resume
+        if run_checkpoint is not None:
+            run_checkpoint.clear()
+        
+        # Collect the results of the stages that ran
+        results = {
+            key: graph.tasks[name].result
+            for key, name in result_tasks.items()
+            if not graph.tasks[name].skipped
+        }
         
         logger.info("COVID-19 ETL pipeline completed successfully")
         return results
@@ -216,6 +928,9 @@ def run_pipeline(csv_path=None, json_path=None, api_url=None, html_url=None, exp
     except Exception as e:
         logger.error(f"Pipeline failed: {e}")
         raise
+    
+    finally:
+        resources.close()
 
 class SimpleScheduler:
     """
@@ -0,0 +1,221 @@
+"""
+Process-pool execution of the CPU-bound pipeline steps.
+
+The worker processes come from worker_pool.process_pool() and import this
+module to run their work. It must therefore not import config, which
+configures logging and creates directories on import. The transformers
+are passed in by the caller rather than imported, so the stage cache does
+not tie apply_partitioned to the code of every transformer. DataFrames
+are passed between processes as Arrow IPC streams, or as memory-mapped
+Arrow IPC files in an intermediate directory so that only their paths
+are sent.
+
+Two modes are supported: a whole dataset branch per worker process
+(transform_in_process) and a single transformer applied to row partitions
+of a large dataset (apply_partitioned).
+"""
+import os
+import uuid
+import pickle
+import logging
+import numpy as np
+import pandas as pd
+from intermediate import write_frame, read_frame
+
+logger = logging.getLogger(__name__)
+
+def transform_in_process(executor, df, label, steps, validate, validation_options=None, intermediate_dir=None):
+    """
+    Transform and validate a dataset in a worker process.
+    
+    Args:
+        executor (concurrent.futures.ProcessPoolExecutor): Pool from worker_pool.process_pool()
+        df (pandas.DataFrame): Extracted data
+        label (str): Dataset label used in log messages
+        steps (list): (function, kwargs) pairs of the module-level transformers to apply
+                      in order, each taking a DataFrame and a copy argument
+        validate (callable): Module-level function validating the transformed data,
+                             such as validate_covid_data
+        validation_options (dict, optional): Extra arguments for validate
+        intermediate_dir (str, optional): Directory to pass the data through as
+                                          memory-mapped files
+                                          
+    Returns:
+        pandas.DataFrame: Transformed data, with the validation outcome in ``attrs['valid']``
+    """
+    logger.info(f"Transforming and validating {label} data in a worker process")
+    
+    payload = serialize_frame(df, directory=intermediate_dir)
+    try:
+        future = executor.submit(transform_branch, payload, steps, validate, validation_options, intermediate_dir)
+        result_payload, valid = future.result()
+    finally:
+        discard_frame(payload)
+    
+    transformed_df = deserialize_frame(result_payload)
+    discard_frame(result_payload)
+    transformed_df.attrs['valid'] = valid
+    return transformed_df
+
+def apply_partitioned(func, df, partitions, executor, min_rows=0, intermediate_dir=None, **kwargs):
+    """
+    Apply a transformer to row partitions of a DataFrame in worker processes.
+    
+    The DataFrame is split into contiguous row partitions, each one is
+    transformed in a worker process and the results are concatenated in the
+    original row order. This only gives the same result as a single call for
+    transformers that treat every row independently, such as
+    standardize_dates, normalize_locations and create_calculated_fields.
+    
+    With an intermediate directory the DataFrame is written to a single
+    memory-mapped file, which every worker maps to read its own rows.
+    
+    Args:
+        func (callable): Module-level transformer taking a DataFrame and a copy argument
+        df (pandas.DataFrame): DataFrame to transform
+        partitions (int): Number of row partitions
+        executor (concurrent.futures.ProcessPoolExecutor): Pool from worker_pool.process_pool()
+        min_rows (int, optional): Transform smaller DataFrames in this process instead
+        intermediate_dir (str, optional): Directory to pass the data through as
+                                          memory-mapped files
+        **kwargs: Additional arguments for the transformer
+        
+    Returns:
+        pandas.DataFrame: Transformed DataFrame
+    """
+    partitions = max(1, min(partitions, len(df)))
+    if partitions == 1 or len(df) < min_rows:
+        return func(df, **kwargs)
+    
+    logger.info(f"Applying {func.__name__} to {partitions} partitions of {len(df)} rows")
+    
+    # The workers get their own copy of each partition
+    worker_kwargs = dict(kwargs, copy=False)
+    bounds = np.linspace(0, len(df), partitions + 1).astype(int)
+    ranges = list(zip(bounds[:-1], bounds[1:]))
+    
+    shared = serialize_frame(df, directory=intermediate_dir) if intermediate_dir else None
+    try:
+        if shared is not None and shared[0] == 'file':
+            futures = [
+                executor.submit(_apply_to_partition, func, shared, worker_kwargs, (start, stop), intermediate_dir)
+                for start, stop in ranges
+            ]
+        else:
+            futures = [
+                executor.submit(_apply_to_partition, func, serialize_frame(df.iloc[start:stop]), worker_kwargs)
+                for start, stop in ranges
+            ]
+        payloads = [future.result() for future in futures]
+    finally:
+        if shared is not None:
+            discard_frame(shared)
+    
+    parts = []
+    for (start, stop), payload in zip(ranges, payloads):
+        part = deserialize_frame(payload)
+        discard_frame(payload)
+        
+        # Rows read from the shared file are numbered from the start of the partition
+        if shared is not None and shared[0] == 'file':
+            part.index = df.index[start:stop]
+        parts.append(part)
+    
+    transformed_df = pd.concat(parts)
+    transformed_df.attrs = dict(df.attrs)
+    return transformed_df
+
+def transform_branch(payload, steps, validate, validation_options=None, intermediate_dir=None):
+    """
+    Run the transformation steps and validation of a dataset, in a worker process.
+    
+    Args:
+        payload (tuple): Serialized DataFrame from serialize_frame()
+        steps (list): (function, kwargs) pairs of the transformers to apply in order
+        validate (callable): Function validating the transformed data
+        validation_options (dict, optional): Extra arguments for validate
+        intermediate_dir (str, optional): Directory to write the transformed data to
+        
+    Returns:
+        tuple: Serialized transformed DataFrame and whether it passed validation
+    """
+    df = deserialize_frame(payload)
+    
+    # The worker owns its copy of the data, so it is transformed in place
+    for function, kwargs in steps:
+        df = function(df, **dict(kwargs, copy=False))
+    
+    valid = validate(df, **(validation_options or {}))
+    return serialize_frame(df, directory=intermediate_dir), valid
+
+def serialize_frame(df, directory=None):
+    """
+    Serialize a DataFrame for another process, as Arrow IPC where possible.
+    
+    Args:
+        df (pandas.DataFrame): DataFrame to serialize
+        directory (str, optional): Write the DataFrame to a memory-mappable file in this
+                                   directory and pass only its path
+                                   
+    Returns:
+        tuple: Serialization format ('arrow', 'file' or 'pickle'), the serialized data or
+               file path and the DataFrame attrs
+    """
+    import pyarrow as pa
+    
+    try:
+        if directory:
+            path = os.path.join(directory, f"{uuid.uuid4().hex}.arrow")
+            write_frame(df, path)
+            return 'file', path, dict(df.attrs)
+        
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        # Columns mixing Python types have no Arrow equivalent
+        logger.info(f"Falling back to pickle, DataFrame is not Arrow compatible: {e}")
+        return 'pickle', pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL), dict(df.attrs)
+    
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    
+    return 'arrow', sink.getvalue(), dict(df.attrs)
+
+def deserialize_frame(payload, rows=None):
+    """
+    Deserialize a DataFrame serialized by serialize_frame().
+    
+    Args:
+        payload (tuple): Serialized DataFrame
+        rows (tuple, optional): (start, stop) positions of the rows to read from a file
+        
+    Returns:
+        pandas.DataFrame: The DataFrame
+    """
+    import pyarrow as pa
+    
+    data_format, data, attrs = payload
+    
+    if data_format == 'file':
+        df = read_frame(data, rows=rows)
+    elif data_format == 'arrow':
+        df = pa.ipc.open_stream(data).read_all().to_pandas()
+    else:
+        df = pickle.loads(data)
+    
+    df.attrs = attrs
+    return df
+
+def discard_frame(payload):
+    """Remove the file of a DataFrame serialized to a file by serialize_frame()."""
+    data_format, data, _ = payload
+    
+    if data_format == 'file':
+        try:
+            os.remove(data)
+        except OSError as e:
+            logger.warning(f"Could not remove intermediate file {data}: {e}")
+
+def _apply_to_partition(func, payload, kwargs, rows=None, directory=None):
+    """Apply a transformer to a row partition, in a worker process."""
+    return serialize_frame(func(deserialize_frame(payload, rows=rows), **kwargs), directory=directory)
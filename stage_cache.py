@@ -0,0 +1,252 @@
+"""
+On-disk cache of pipeline stage outputs.
+
+Each cached stage result is stored as an Arrow IPC file, keyed on the
+stage function, the source code of its module and a hash of its
+arguments. The source includes the project modules the stage's module
+imports, directly or through other project modules. DataFrame arguments
+are hashed by content, file path arguments by their fingerprint and
+function arguments by their source, so a stage is only recomputed when
+its inputs or its code change.
+"""
+import os
+import ast
+import glob
+import hashlib
+import inspect
+import logging
+import threading
+import pandas as pd
+from concurrent.futures import Executor
+from utils import file_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Modules below this directory are part of the project's code
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+class StageCache:
+    """Arrow IPC cache of stage output DataFrames with size-based LRU eviction."""
+    
+    def __init__(self, cache_dir, max_bytes):
+        """
+        Initialize the cache.
+        
+        Args:
+            cache_dir (str): Directory to store the cached results in
+            max_bytes (int): Evict the least recently used results once the cache
+                             grows beyond this many bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._code_versions = {}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def key(self, function, kwargs):
+        """
+        Compute the cache key of a stage.
+        
+        Args:
+            function (callable): Stage function
+            kwargs (dict): Arguments the function is called with
+            
+        Returns:
+            str: The cache key, or None if the arguments cannot be hashed
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{function.__module__}.{function.__qualname__}".encode())
+        digest.update(self._code_version(function).encode())
+        
+        try:
+            for name in sorted(kwargs):
+                digest.update(name.encode())
+                digest.update(self._hash_value(kwargs[name]))
+        except TypeError as e:
+            logger.info(f"Not caching {function.__qualname__}, its arguments cannot be hashed: {e}")
+            return None
+        
+        return digest.hexdigest()
+    
+    def get(self, key):
+        """
+        Read a cached stage result.
+        
+        Args:
+            key (str): Cache key of the stage
+            
+        Returns:
+            pandas.DataFrame: The cached result, or None if there is none
+        """
+        import pyarrow as pa
+        
+        path = self._path(key)
+        try:
+            with pa.OSFile(path, 'rb') as source:
+                df = pa.ipc.open_file(source).read_all().to_pandas()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached result {path}: {e}")
+            return None
+        
+        # Mark the result as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        
+        return df
+    
+    def put(self, key, result):
+        """
+        Store a stage result, evicting old results if the cache is too large.
+        
+        Results other than DataFrames are not cached.
+        
+        Args:
+            key (str): Cache key of the stage
+            result (object): Result of the stage
+            
+        Returns:
+            bool: True if the result was stored, False otherwise
+        """
+        import pyarrow as pa
+        
+        if not isinstance(result, pd.DataFrame):
+            return False
+        
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        
+        try:
+            table = pa.Table.from_pandas(result)
+            with pa.OSFile(temp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not cache stage result: {e}")
+            return False
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        self.evict()
+        return True
+    
+    def evict(self):
+        """Remove the least recently used results until the cache fits in max_bytes."""
+        with self._lock:
+            entries = []
+            for path in glob.glob(os.path.join(self.cache_dir, "*.arrow")):
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_bytes <= self.max_bytes:
+                    break
+                
+                try:
+                    os.remove(path)
+                    logger.info(f"Evicted cached result {os.path.basename(path)} ({size} bytes)")
+                except FileNotFoundError:
+                    pass
+                total_bytes -= size
+    
+    def _path(self, key):
+        """Get the path of a cached result."""
+        return os.path.join(self.cache_dir, f"{key}.arrow")
+    
+    def _code_version(self, function):
+        """Hash the source of the module defining a function and of the project modules it depends on."""
+        module_path = os.path.abspath(inspect.getsourcefile(function))
+        
+        # The loaded code does not change while the process runs
+        if module_path not in self._code_versions:
+            digest = hashlib.blake2b(digest_size=16)
+            for path in sorted(project_dependencies(module_path)):
+                digest.update(os.path.relpath(path, PROJECT_ROOT).encode())
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+            self._code_versions[module_path] = digest.hexdigest()
+        
+        return self._code_versions[module_path]
+    
+    def _hash_value(self, value):
+        """Hash a stage argument: DataFrames by content, existing files by fingerprint."""
+        if isinstance(value, pd.DataFrame):
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(repr([(str(column), str(dtype)) for column, dtype in value.dtypes.items()]).encode())
+            digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+            return digest.digest()
+        
+        if isinstance(value, str) and os.path.isfile(value):
+            fingerprint = file_fingerprint(value)
+            return f"file:{fingerprint['size']}:{fingerprint['hash']}".encode()
+        
+        # Functions passed to a stage are versioned like the stage itself
+        if inspect.isfunction(value):
+            return f"function:{value.__module__}.{value.__qualname__}:{self._code_version(value)}".encode()
+        
+        # Executors only decide where the work runs
+        if isinstance(value, Executor):
+            return b"executor"
+        
+        return repr(value).encode()
+
+def project_dependencies(module_path):
+    """
+    Find the project modules a module imports, directly or through other project modules.
+    
+    Imports are read from the source, including those inside functions.
+    Modules outside the project, such as pandas, are not followed.
+    
+    Args:
+        module_path (str): Path to the module's source file
+        
+    Returns:
+        set: Paths to the module and the project modules it depends on
+    """
+    found = set()
+    pending = [os.path.abspath(module_path)]
+    
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        found.add(path)
+        
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=path)
+        
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                # Imported names can be submodules of the package
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            
+            for name in names:
+                pending.extend(_module_files(name))
+    
+    return found
+
+def _module_files(name):
+    """Get the project source files of a dotted module name, including its packages' __init__ files."""
+    parts = name.split('.')
+    files = []
+    
+    for depth in range(1, len(parts) + 1):
+        base = os.path.join(PROJECT_ROOT, *parts[:depth])
+        for candidate in (f"{base}.py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(candidate):
+                files.append(candidate)
+    
+    return files
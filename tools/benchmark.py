@@ -0,0 +1,188 @@
+"""
+Benchmarks for the COVID-19 ETL pipeline.
+
+Run from the project root, for example:
+    
+    python tools/benchmark.py memory --rows 1000000
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+# Make the pipeline modules importable when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transformers.date_transformer import standardize_dates
+from transformers.location_transformer import normalize_locations
+from transformers.missing_value_handler import handle_missing_values
+from transformers.calculator import create_calculated_fields
+from loaders.sql_loader import load_to_sqlite
+from extractors.api_extractor import extract_from_api
+from validators.data_validator import validate_covid_data
+from worker_pool import process_pool
+from parallel import apply_partitioned
+from mock_api import create_mock_api
+
+REGIONS = ["CA", "NY", "TX", "FL", "PA", "wash", "d.c.", "Ohio"]
+
+def make_cases(rows, seed=0):
+    """
+    Build a synthetic cases DataFrame shaped like sample_data/cases.csv.
+    
+    Args:
+        rows (int): Number of rows to generate
+        seed (int, optional): Random seed
+        
+    Returns:
+        pandas.DataFrame: Synthetic case data
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2020-01-01", periods=1000).strftime("%Y-%m-%d")
+    total_tests = rng.integers(1000, 20000, rows)
+    positive_tests = (total_tests * rng.uniform(0, 0.3, rows)).astype(int)
+    deaths = rng.integers(0, 100, rows).astype(float)
+    deaths[rng.random(rows) < 0.01] = np.nan
+    
+    return pd.DataFrame({
+        'date': rng.choice(dates, rows),
+        'region': rng.choice(REGIONS, rows),
+        'confirmed_cases': positive_tests,
+        'deaths': deaths,
+        'recovered': (positive_tests * 0.8).astype(int),
+        'active_cases': (positive_tests * 0.2).astype(int),
+        'total_tests': total_tests,
+        'positive_tests': positive_tests
+    })
+
+def benchmark_memory(rows):
+    """Compare peak memory of the transformer chain with and without copies."""
+    for copy in (True, False):
+        df = make_cases(rows)
+        input_bytes = df.memory_usage(deep=True).sum()
+        
+        tracemalloc.start()
+        start_time = time.time()
+        df = standardize_dates(df, date_columns=['date'], copy=copy)
+        df = normalize_locations(df, location_columns=['region'], copy=copy)
+        df = handle_missing_values(df, copy=copy)
+        df = create_calculated_fields(df, copy=copy)
+        elapsed = time.time() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        mode = "copy" if copy else "copy-free"
+        print(f"{mode:>10}: peak {peak / 2**20:8.1f} MiB "
+              f"({peak / input_bytes:.1f}x input of {input_bytes / 2**20:.1f} MiB), {elapsed:.2f} seconds")
+
+def benchmark_load(rows, chunk_size):
+    """Compare SQLite load throughput of DataFrame.to_sql and the fast loader."""
+    df = make_cases(rows)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for fast in (False, True):
+            db_uri = f"sqlite:///{os.path.join(temp_dir, f'benchmark_{fast}.db')}"
+            
+            start_time = time.time()
+            load_to_sqlite(df, 'covid_cases', db_uri, fast=fast, chunk_size=chunk_size)
+            elapsed = time.time() - start_time
+            
+            mode = "fast" if fast else "to_sql"
+            print(f"{mode:>10}: {rows / elapsed:12,.0f} rows/second ({elapsed:.2f} seconds)")
+
+def benchmark_api(rows, page_size, workers, latency):
+    """Compare serial and concurrent paging against the mock API."""
+    server = create_mock_api(port=0, rows=rows, latency=latency, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://localhost:{server.server_address[1]}/covid/vaccinations"
+    
+    try:
+        for max_workers in (1, workers):
+            start_time = time.time()
+            df = extract_from_api(api_url, page_size=page_size, max_workers=max_workers)
+            elapsed = time.time() - start_time
+            
+            print(f"{max_workers:>3} workers: {len(df)} records in {elapsed:.2f} seconds")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def benchmark_partitions(rows, partitions):
+    """Compare the row-wise transformers in one process and on row partitions."""
+    df = make_cases(rows)
+    steps = [
+        (standardize_dates, {'date_columns': ['date']}),
+        (normalize_locations, {'location_columns': ['region']}),
+        (create_calculated_fields, {})
+    ]
+    
+    with process_pool(max_workers=partitions) as executor:
+        # Start the worker processes before timing
+        list(executor.map(abs, range(partitions)))
+        
+        for count in (1, partitions):
+            start_time = time.time()
+            result = df
+            for func, kwargs in steps:
+                result = apply_partitioned(func, result, count, executor, **kwargs)
+            elapsed = time.time() - start_time
+            
+            print(f"{count:>3} partitions: {rows / elapsed:12,.0f} rows/second ({elapsed:.2f} seconds)")
+
+def benchmark_validate(rows, sample_size):
+    """Compare validate_covid_data in the exact, compiled and sampled modes."""
+    df = create_calculated_fields(make_cases(rows))
+    
+    for mode in ("exact", "compiled", "sampled"):
+        start_time = time.time()
+        valid = validate_covid_data(df, mode=mode, sample_size=sample_size)
+        elapsed = time.time() - start_time
+        
+        print(f"{mode:>8}: {rows / elapsed:12,.0f} rows/second ({elapsed:.2f} seconds, valid={valid})")
+
+def main():
+    """Run the selected benchmark."""
+    parser = argparse.ArgumentParser(description='COVID-19 ETL Pipeline benchmarks')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+    
+    memory_parser = subparsers.add_parser('memory', help='Peak memory of the transformer chain')
+    memory_parser.add_argument('--rows', type=int, default=1000000, help='Number of rows')
+    
+    load_parser = subparsers.add_parser('load', help='SQLite load throughput')
+    load_parser.add_argument('--rows', type=int, default=1000000, help='Number of rows')
+    load_parser.add_argument('--chunk_size', type=int, default=50000, help='Rows per insert batch')
+    
+    api_parser = subparsers.add_parser('api', help='Paginated API extraction against the mock API')
+    api_parser.add_argument('--rows', type=int, default=100000, help='Number of records served')
+    api_parser.add_argument('--page_size', type=int, default=5000, help='Records per page')
+    api_parser.add_argument('--workers', type=int, default=8, help='Concurrent page requests')
+    api_parser.add_argument('--latency', type=float, default=0.05, help='Simulated latency per request in seconds')
+    
+    partitions_parser = subparsers.add_parser('partitions', help='Row-partitioned transformers in worker processes')
+    partitions_parser.add_argument('--rows', type=int, default=1000000, help='Number of rows')
+    partitions_parser.add_argument('--partitions', type=int, default=os.cpu_count(), help='Number of row partitions')
+    
+    validate_parser = subparsers.add_parser('validate', help='Exact, compiled and sampled validation')
+    validate_parser.add_argument('--rows', type=int, default=1000000, help='Number of rows')
+    validate_parser.add_argument('--sample_size', type=int, default=100000, help='Rows validated in sampled mode')
+    
+    args = parser.parse_args()
+    
+    if args.benchmark == 'memory':
+        benchmark_memory(args.rows)
+    elif args.benchmark == 'load':
+        benchmark_load(args.rows, args.chunk_size)
+    elif args.benchmark == 'api':
+        benchmark_api(args.rows, args.page_size, args.workers, args.latency)
+    elif args.benchmark == 'partitions':
+        benchmark_partitions(args.rows, args.partitions)
+    elif args.benchmark == 'validate':
+        benchmark_validate(args.rows, args.sample_size)
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 """
 Mock API server for testing the COVID-19 ETL pipeline.
 """
+import gzip
 import json
+import time
+import hashlib
+import argparse
 import http.server
 import socketserver
 from urllib.parse import urlparse, parse_qs
+from email.utils import formatdate, parsedate_to_datetime
 
 # Sample vaccination data
 VACCINATION_DATA = [
@@ -58,52 +63,182 @@ VACCINATION_DATA = [
     }
 ]
 
+def generate_vaccination_data(rows):
+    """
+    Generate synthetic vaccination records for paging tests and benchmarks.
+    
+    Args:
+        rows (int): Number of records to generate
+        
+    Returns:
+        list: List of vaccination records
+    """
+    regions = sorted({record["region"] for record in VACCINATION_DATA})
+    populations = {record["region"]: record["population"] for record in VACCINATION_DATA}
+    
+    records = []
+    for i in range(rows):
+        day, region = divmod(i, len(regions))
+        region = regions[region]
+        records.append({
+            "date": f"2023-{1 + day // 28 % 12:02d}-{1 + day % 28:02d}",
+            "region": region,
+            "total_vaccinations": 100000 + i,
+            "people_vaccinated": 60000 + i,
+            "people_fully_vaccinated": 40000 + i,
+            "population": populations[region]
+        })
+    return records
+
 class MockAPIHandler(http.server.SimpleHTTPRequestHandler):
     """Handler for the mock COVID-19 API server."""
     
+    # Keep connections alive between requests like a real API server
+    protocol_version = "HTTP/1.1"
+    
+    # Records served by the vaccinations endpoint
+    data = VACCINATION_DATA
+    
+    # Simulated network latency per request in seconds
+    latency = 0
+    
+    # Whether to skip logging every request
+    quiet = False
+    
+    # Time the data was last modified, sent as Last-Modified
+    last_modified = time.time()
+    
     def do_GET(self):
         """Handle GET requests."""
         # Parse URL
         parsed_url = urlparse(self.path)
         
+        if self.latency:
+            time.sleep(self.latency)
+        
         # Handle different endpoints
         if parsed_url.path == "/covid/vaccinations":
-            self._handle_vaccinations()
+            self._handle_vaccinations(parse_qs(parsed_url.query))
         else:
             # Default 404 response
-            self.send_response(404)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": "Endpoint not found"}).encode())
+            self._send_json(404, {"error": "Endpoint not found"})
     
-    def _handle_vaccinations(self):
+    def _handle_vaccinations(self, query):
         """Handle requests to the vaccinations endpoint."""
-        self.send_response(200)
-        self.send_header("Content-type", "application/json")
-        self.end_headers()
+        # Socrata-style paging with $offset and $limit
+        offset = int(query.get("$offset", ["0"])[0])
+        limit = int(query.get("$limit", [str(len(self.data))])[0])
+        records = self.data[offset:offset + limit]
         
         # Return vaccination data
         response_data = {
-            "data": VACCINATION_DATA,
+            "data": records,
             "metadata": {
-                "total_records": len(VACCINATION_DATA),
+                "total_records": len(self.data),
+                "offset": offset,
+                "limit": limit,
                 "source": "Mock API"
             }
         }
         
-        self.wfile.write(json.dumps(response_data).encode())
+        self._send_json(200, response_data)
+    
+    def _send_json(self, status, payload):
+        """Send a JSON response, gzip compressed if the client accepts it."""
+        body = json.dumps(payload).encode()
+        
+        if status == 200:
+            # Validators for conditional requests
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            last_modified = formatdate(self.last_modified, usegmt=True)
+            
+            if self._not_modified(etag):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", last_modified)
+                self.end_headers()
+                return
+        
+        self.send_response(status)
+        self.send_header("Content-type", "application/json")
+        if status == 200:
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        
+        self.wfile.write(body)
+    
+    def _not_modified(self, etag):
+        """Check the If-None-Match and If-Modified-Since request headers."""
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since
+            return if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+        
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since is not None:
+            try:
+                return int(self.last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        
+        return False
+    
+    def log_message(self, format, *args):
+        """Log requests unless the server is quiet."""
+        if not self.quiet:
+            super().log_message(format, *args)
+
+class MockAPIServer(socketserver.ThreadingTCPServer):
+    """Mock API server that handles each request in its own thread."""
+    
+    allow_reuse_address = True
+    daemon_threads = True
 
-def start_mock_api(port=8000):
+def create_mock_api(port=8000, rows=None, latency=0, quiet=False):
+    """
+    Create the mock API server without starting it.
+    
+    Args:
+        port (int): Port to listen on, 0 for any free port
+        rows (int, optional): Serve this many synthetic records instead of the sample data
+        latency (float, optional): Simulated network latency per request in seconds
+        quiet (bool, optional): Do not log requests
+        
+    Returns:
+        MockAPIServer: The server, ready to serve requests
+    """
+    handler_attributes = {'latency': latency, 'quiet': quiet, 'last_modified': time.time()}
+    if rows is not None:
+        handler_attributes['data'] = generate_vaccination_data(rows)
+    handler = type("ConfiguredMockAPIHandler", (MockAPIHandler,), handler_attributes)
+    
+    return MockAPIServer(("", port), handler)
+
+def start_mock_api(port=8000, rows=None, latency=0):
     """
     Start the mock API server.
     
     Args:
         port (int): Port to listen on
+        rows (int, optional): Serve this many synthetic records instead of the sample data
+        latency (float, optional): Simulated network latency per request in seconds
     """
-    handler = MockAPIHandler
-    with socketserver.TCPServer(("", port), handler) as httpd:
+    with create_mock_api(port, rows=rows, latency=latency) as httpd:
         print(f"Mock API server running at http://localhost:{port}")
         httpd.serve_forever()
 
 if __name__ == "__main__":
-    start_mock_api()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Mock COVID-19 API server')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on')
+    parser.add_argument('--rows', type=int, default=None,
+                        help='Serve this many synthetic records instead of the sample data')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='Simulated network latency per request in seconds')
+    args = parser.parse_args()
+    
+    start_mock_api(port=args.port, rows=args.rows, latency=args.latency)
\ No newline at end of file
@@ -7,12 +7,15 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
-def create_calculated_fields(df):
+def create_calculated_fields(df, copy=True):
     """
     Create calculated fields from COVID-19 data.
     
     Args:
         df (pandas.DataFrame): DataFrame to transform
+        copy (bool, optional): Work on a copy of the DataFrame. If False, the
+                               DataFrame is modified in place and must not be
+                               reused by the caller.
         
     Returns:
         pandas.DataFrame: DataFrame with calculated fields
@@ -20,8 +23,11 @@ def create_calculated_fields(df):
     logger.info("Creating calculated fields")
     
     try:
-        # Create a copy of the DataFrame to avoid modifying the original
-        transformed_df = df.copy()
+        original_columns = set(df.columns)
+        
+        # Create a copy of the DataFrame to avoid modifying the original,
+        # unless the caller hands over ownership of it
+        transformed_df = df.copy() if copy else df
         
         # Calculate positivity rate if required columns exist
         if 'positive_tests' in transformed_df.columns and 'total_tests' in transformed_df.columns:
@@ -64,7 +70,7 @@ def create_calculated_fields(df):
             logger.info("Hospital utilization rate calculated successfully")
         
         # Log which calculated fields were created
-        new_fields = set(transformed_df.columns) - set(df.columns)
+        new_fields = set(transformed_df.columns) - original_columns
         if new_fields:
             logger.info(f"Created {len(new_fields)} new calculated fields: {new_fields}")
         else:
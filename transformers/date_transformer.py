@@ -2,18 +2,40 @@
 Module for standardizing date formats across all data sources.
 """
 import logging
+import warnings
+import numpy as np
 import pandas as pd
-from utils import parse_date_string, standardize_date_format
+from pandas.tseries.api import guess_datetime_format
+from utils import parse_date_string, standardize_date_format, map_unique
 
 logger = logging.getLogger(__name__)
 
-def standardize_dates(df, date_columns):
+# Output format for all standardized dates
+OUTPUT_DATE_FORMAT = "%Y-%m-%d"
+
+# Formats tried with the vectorized parser before falling back to dateutil.
+# Each one must be read the same way as dateutil would read it.
+DEFAULT_DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y/%m/%d",
+    "%m/%d/%Y"
+]
+
+def standardize_dates(df, date_columns, formats=None, copy=True):
     """
     Standardize date formats in a DataFrame.
     
     Args:
         df (pandas.DataFrame): DataFrame to transform
         date_columns (list): List of column names containing dates
+        formats (list, optional): Date formats to try with the vectorized parser
+                                  before falling back to per-value parsing
+        copy (bool, optional): Work on a copy of the DataFrame. If False, the
+                               DataFrame is modified in place and must not be
+                               reused by the caller.
         
     Returns:
         pandas.DataFrame: DataFrame with standardized dates
@@ -21,8 +43,9 @@ def standardize_dates(df, date_columns):
     logger.info(f"Standardizing date formats for columns: {date_columns}")
     
     try:
-        # Create a copy of the DataFrame to avoid modifying the original
-        transformed_df = df.copy()
+        # Create a copy of the DataFrame to avoid modifying the original,
+        # unless the caller hands over ownership of it
+        transformed_df = df.copy() if copy else df
         
         # Find actual date columns that exist in the DataFrame
         existing_date_cols = [col for col in date_columns if col in transformed_df.columns]
@@ -36,9 +59,7 @@ def standardize_dates(df, date_columns):
             logger.info(f"Standardizing date column: {col}")
             
             # Parse dates and standardize format
-            transformed_df[col] = transformed_df[col].apply(
-                lambda x: standardize_date_format(parse_date_string(x))
-            )
+            transformed_df[col] = standardize_date_series(transformed_df[col], formats=formats)
             
             # Count null values after transformation
             null_count = transformed_df[col].isna().sum()
@@ -50,4 +71,82 @@ def standardize_dates(df, date_columns):
     
     except Exception as e:
         logger.error(f"Error standardizing dates: {e}")
-        return df  # Return original DataFrame on error
\ No newline at end of file
+        return df  # Return original DataFrame on error
+
+def standardize_date_series(series, formats=None):
+    """
+    Convert a Series of dates to standardized date strings.
+    
+    Each distinct value is parsed once, with pandas.to_datetime using the
+    configured formats and a format inferred from the data. Only values
+    that match none of them are parsed one by one with dateutil, so the
+    result is the same as applying parse_date_string and
+    standardize_date_format to every value.
+    
+    Args:
+        series (pandas.Series): Series containing date values
+        formats (list, optional): Date formats to try before falling back to dateutil
+        
+    Returns:
+        pandas.Series: Series of date strings, with None for missing or invalid dates
+    """
+    return map_unique(series, lambda values: _standardize_date_values(values, formats), vectorized=True)
+
+def _standardize_date_values(series, formats):
+    """Standardize a Series of dates with vectorized parsing and a dateutil fallback."""
+    values = series.to_numpy(dtype=object)
+    result = np.full(len(values), None, dtype=object)
+    
+    # Missing and empty values stay None
+    missing = pd.isna(values) | (values == "")
+    positions = np.flatnonzero(~missing)
+    text = pd.Series(values[positions]).astype(str)
+    
+    formats = list(formats or DEFAULT_DATE_FORMATS)
+    inferred_format = _infer_date_format(text)
+    if inferred_format and inferred_format not in formats:
+        formats.append(inferred_format)
+    
+    # Vectorized parsing, one format at a time on the values still unparsed
+    for date_format in formats:
+        if len(positions) == 0:
+            break
+        
+        parsed = pd.to_datetime(text, format=date_format, errors='coerce')
+        matched = parsed.notna().to_numpy()
+        if matched.any():
+            result[positions[matched]] = parsed[matched].dt.strftime(OUTPUT_DATE_FORMAT).to_numpy()
+            positions = positions[~matched]
+            text = text[~matched].reset_index(drop=True)
+    
+    # Fall back to dateutil for the values no format matched
+    if len(positions) > 0:
+        logger.info(f"Parsing {len(positions)} date values individually")
+        result[positions] = [
+            standardize_date_format(parse_date_string(value)) for value in values[positions]
+        ]
+    
+    return pd.Series(result, index=series.index, name=series.name)
+
+def _infer_date_format(text):
+    """
+    Guess the date format of a Series of strings from its first value.
+    
+    Formats that dateutil could read differently are rejected, namely
+    two-digit years, day-before-month orders and formats without a day,
+    such as "2021-03", which dateutil completes with the current day.
+    """
+    if text.empty:
+        return None
+    
+    # pandas warns when it can only read the value day first, which is rejected below anyway
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        date_format = guess_datetime_format(text.iloc[0], dayfirst=False)
+    if date_format is None or "%y" in date_format or "%d" not in date_format:
+        return None
+    
+    if "%m" in date_format and date_format.index("%d") < date_format.index("%m"):
+        return None
+    
+    return date_format
@@ -3,7 +3,7 @@ Module for normalizing region/location names across all data sources.
 """
 import logging
 import pandas as pd
-from utils import clean_string
+from utils import clean_string, map_unique
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +29,16 @@ LOCATION_MAPPING = {
     "d.c.": "district of columbia"
 }
 
-def normalize_locations(df, location_columns):
+def normalize_locations(df, location_columns, copy=True):
     """
     Normalize location names in a DataFrame.
     
     Args:
         df (pandas.DataFrame): DataFrame to transform
         location_columns (list): List of column names containing location info
+        copy (bool, optional): Work on a copy of the DataFrame. If False, the
+                               DataFrame is modified in place and must not be
+                               reused by the caller.
         
     Returns:
         pandas.DataFrame: DataFrame with normalized location names
@@ -43,8 +46,9 @@ def normalize_locations(df, location_columns):
     logger.info(f"Normalizing location names for columns: {location_columns}")
     
     try:
-        # Create a copy of the DataFrame to avoid modifying the original
-        transformed_df = df.copy()
+        # Create a copy of the DataFrame to avoid modifying the original,
+        # unless the caller hands over ownership of it
+        transformed_df = df.copy() if copy else df
         
         # Find actual location columns that exist in the DataFrame
         existing_location_cols = [col for col in location_columns if col in transformed_df.columns]
@@ -57,8 +61,8 @@ def normalize_locations(df, location_columns):
         for col in existing_location_cols:
             logger.info(f"Normalizing location column: {col}")
             
-            # Clean strings and apply mapping
-            transformed_df[col] = transformed_df[col].apply(lambda x: clean_location(x))
+            # Clean strings and apply mapping, once per distinct location
+            transformed_df[col] = map_unique(transformed_df[col], clean_location)
             
             # Count null values after transformation
             null_count = transformed_df[col].isna().sum()
@@ -7,7 +7,7 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
-def handle_missing_values(df, strategy="default"):
+def handle_missing_values(df, strategy="default", copy=True):
     """
     Handle missing values in a DataFrame using the specified strategy.
     
@@ -17,6 +17,9 @@ def handle_missing_values(df, strategy="default"):
                        - "default": Use type-specific defaults
                        - "drop_rows": Drop rows with any missing values
                        - "drop_columns": Drop columns with any missing values
+        copy (bool, optional): Work on a copy of the DataFrame. If False, the
+                               DataFrame is modified in place and must not be
+                               reused by the caller.
         
     Returns:
         pandas.DataFrame: DataFrame with handled missing values
@@ -24,8 +27,9 @@ def handle_missing_values(df, strategy="default"):
     logger.info(f"Handling missing values using strategy: {strategy}")
     
     try:
-        # Create a copy of the DataFrame to avoid modifying the original
-        transformed_df = df.copy()
+        # Create a copy of the DataFrame to avoid modifying the original,
+        # unless the caller hands over ownership of it
+        transformed_df = df.copy() if copy else df
         
         # Get missing value counts
         missing_counts = transformed_df.isna().sum()
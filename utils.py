@@ -2,7 +2,9 @@
 Utility functions for the COVID-19 ETL pipeline.
 """
 import os
+import hashlib
 import logging
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import dateutil.parser as date_parser
@@ -50,4 +52,73 @@ def clean_string(text):
         return None
     
     # Convert to string, strip whitespace, and convert to lowercase
-    return str(text).strip().lower()
\ No newline at end of file
+    return str(text).strip().lower()
+
+def map_unique(series, func, vectorized=False):
+    """
+    Apply a function once per distinct value of a Series and broadcast the results.
+    
+    The cost of the function calls depends on the number of distinct values
+    rather than on the number of rows. Missing values are passed to the
+    function only once.
+    
+    Args:
+        series (pandas.Series): Series to transform
+        func (callable): Function applied to each distinct value, or to a Series
+                         of all distinct values if vectorized is True
+        vectorized (bool, optional): Whether func takes and returns a whole Series
+        
+    Returns:
+        pandas.Series: Series of results with the same index as the input
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    
+    if vectorized:
+        mapped = pd.Series(func(pd.Series(uniques))).to_numpy(dtype=object)
+    else:
+        mapped = np.empty(len(uniques), dtype=object)
+        mapped[:] = [func(value) for value in uniques]
+    
+    result = mapped.take(codes) if len(mapped) else np.full(len(codes), None, dtype=object)
+    
+    # Missing values share a single result
+    missing = codes == -1
+    if missing.any():
+        sample = series.iloc[[np.argmax(missing)]]
+        result[missing] = pd.Series(func(sample)).iloc[0] if vectorized else func(sample.iloc[0])
+    
+    return pd.Series(result, index=series.index, name=series.name)
+
+def file_fingerprint(file_path, previous=None, block_size=1 << 20):
+    """
+    Fingerprint a file by its size, modification time and content hash.
+    
+    If the previous fingerprint has the same path, size and modification
+    time, its hash is reused instead of reading the file again.
+    
+    Args:
+        file_path (str): Path to the file
+        previous (dict, optional): Previously computed fingerprint of the file
+        block_size (int, optional): Number of bytes hashed at a time
+        
+    Returns:
+        dict: Fingerprint with the path, size, mtime_ns and BLAKE2b hash of the file
+    """
+    stat = os.stat(file_path)
+    fingerprint = {
+        'path': os.path.abspath(file_path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns
+    }
+    
+    if previous and all(previous.get(key) == value for key, value in fingerprint.items()):
+        fingerprint['hash'] = previous['hash']
+        return fingerprint
+    
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    
+    fingerprint['hash'] = digest.hexdigest()
+    return fingerprint
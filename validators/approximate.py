@@ -0,0 +1,160 @@
+"""
+Approximate statistics for validating very large tables.
+
+Provides uniform row sampling, a HyperLogLog sketch for approximate
+distinct counts and confidence bounds for violation rates estimated
+from a sample.
+"""
+import math
+import numpy as np
+import pandas as pd
+
+# 2**14 registers give a relative standard error of about 0.8%
+HLL_PRECISION = 14
+
+# z-score of the 95% confidence bounds
+CONFIDENCE_Z = 1.96
+
+def sample_positions(length, fraction=None, size=None, seed=0):
+    """
+    Draw the positions of a uniform sample of rows without replacement.
+    
+    Args:
+        length (int): Number of rows to sample from
+        fraction (float, optional): Fraction of the rows to sample
+        size (int, optional): Number of rows to sample, used if no fraction is given
+        seed (int, optional): Random seed
+        
+    Returns:
+        numpy.ndarray: Sorted row positions, or None if the sample would contain every row
+    """
+    if fraction is not None:
+        size = int(math.ceil(length * fraction))
+    
+    if size is None or size >= length:
+        return None
+    
+    # Sorted positions read the sampled rows in their original order
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(length, size=size, replace=False, shuffle=False))
+
+def violation_rate_upper_bound(violations, sampled, exact=False):
+    """
+    Upper 95% confidence bound of the violation rate of a whole column.
+    
+    Uses the rule of three when the sample has no violations and the
+    Wilson score interval otherwise. A sample of every row gives the exact rate.
+    
+    Args:
+        violations (int): Number of violating values in the sample
+        sampled (int): Number of sampled values
+        exact (bool, optional): Whether the sample holds every value of the column
+        
+    Returns:
+        float: Upper bound of the violation rate
+    """
+    if sampled == 0:
+        return 1.0
+    
+    if exact:
+        return violations / sampled
+    
+    if violations == 0:
+        return min(1.0, 3 / sampled)
+    
+    rate = violations / sampled
+    z2 = CONFIDENCE_Z ** 2
+    center = rate + z2 / (2 * sampled)
+    margin = CONFIDENCE_Z * math.sqrt(rate * (1 - rate) / sampled + z2 / (4 * sampled ** 2))
+    return min(1.0, (center + margin) / (1 + z2 / sampled))
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch estimating the number of distinct values.
+    
+    Values are hashed with pandas.util.hash_pandas_object and added a whole
+    Series at a time. Sketches with the same precision can be merged, so a
+    column can be counted in chunks.
+    """
+    
+    def __init__(self, precision=HLL_PRECISION):
+        """
+        Initialize an empty sketch.
+        
+        Args:
+            precision (int, optional): Number of index bits, the sketch has 2**precision registers
+        """
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+    
+    @property
+    def relative_error(self):
+        """Relative standard error of the estimate."""
+        return 1.04 / math.sqrt(len(self.registers))
+    
+    def add(self, values):
+        """
+        Add values to the sketch, missing values are ignored.
+        
+        Args:
+            values (pandas.Series): Values to add
+        """
+        values = values.dropna()
+        if values.empty:
+            return
+        
+        # Integer and float chunks of a column are concatenated as floats,
+        # so equal numbers must hash the same whatever their dtype
+        if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+            values = values.astype(np.float64)
+        
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        
+        # The first bits select the register, the rank is the position
+        # of the first set bit in the remaining ones
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rank = _count_leading_zeros(hashes << np.uint64(self.precision)) + 1
+        rank = np.minimum(rank, 64 - self.precision + 1).astype(np.uint8)
+        
+        np.maximum.at(self.registers, index, rank)
+    
+    def merge(self, other):
+        """
+        Merge another sketch into this one.
+        
+        Args:
+            other (HyperLogLog): Sketch with the same precision
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        
+        np.maximum(self.registers, other.registers, out=self.registers)
+    
+    def count(self):
+        """
+        Estimate the number of distinct values added.
+        
+        Returns:
+            float: Estimated number of distinct values
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        
+        # Linear counting is more accurate for small cardinalities
+        empty = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and empty:
+            estimate = m * math.log(m / empty)
+        
+        return float(estimate)
+
+def _count_leading_zeros(values):
+    """Count the leading zero bits of unsigned 64-bit integers."""
+    # float64 holds integers of up to 53 bits exactly, so the bit length is
+    # taken from the exponent of the high 53 bits, or of the low 11 bits
+    high = values >> np.uint64(11)
+    _, high_length = np.frexp(high.astype(np.float64))
+    _, low_length = np.frexp((values & np.uint64(0x7FF)).astype(np.float64))
+    
+    bit_length = np.where(high != 0, high_length + 11, low_length)
+    return 64 - bit_length
@@ -4,9 +4,13 @@ Module for validating data quality using Great Expectations-like approach.
 import logging
 import pandas as pd
 import numpy as np
+from validators.approximate import HyperLogLog, CONFIDENCE_Z, sample_positions, violation_rate_upper_bound
 
 logger = logging.getLogger(__name__)
 
+# Values of a numeric column reduced at a time, few enough to stay in the CPU cache
+REDUCE_BLOCK_SIZE = 1 << 16
+
 class SimpleValidator:
     """
     A simple data validator inspired by Great Expectations.
@@ -37,10 +41,7 @@ class SimpleValidator:
             return False
         
         null_count = self.df[column].isna().sum()
-        result = null_count == 0
-        self._add_result(f"Column '{column}' has no null values", result, 
-                         details=f"{null_count} null values found" if not result else "")
-        return result
+        return self._record_not_null(column, null_count)
     
     def expect_column_values_to_be_between(self, column, min_value, max_value):
         """Check if all values in a column are between min_value and max_value."""
@@ -51,23 +52,31 @@ class SimpleValidator:
         values = self.df[column].dropna()
         
         if len(values) == 0:
-            self._add_result(f"Column '{column}' values between {min_value} and {max_value}", False,
-                            details="Column has no non-null values")
-            return False
-        
-        min_actual = values.min()
-        max_actual = values.max()
-        result = (min_actual >= min_value) and (max_actual <= max_value)
+            return self._record_between(column, min_value, max_value, 0, None, None)
         
-        self._add_result(f"Column '{column}' values between {min_value} and {max_value}", result,
-                         details=f"Range is {min_actual} to {max_actual}" if not result else "")
-        return result
+        return self._record_between(column, min_value, max_value, len(values), values.min(), values.max())
     
     def expect_column_values_to_be_of_type(self, column, expected_type):
         """Check if all values in a column are of the expected type."""
         if not self.expect_column_to_exist(column):
             return False
         
+        result = self._check_type(column, expected_type)
+        self._add_result(f"Column '{column}' values are of type {expected_type}", result)
+        return result
+    
+    def expect_column_values_to_be_unique(self, column):
+        """Check if all values in a column are unique."""
+        if not self.expect_column_to_exist(column):
+            return False
+        
+        duplicate_count = self.df[column].duplicated().sum()
+        return self._record_unique(column, duplicate_count)
+    
+    def _check_type(self, column, expected_type, values=None):
+        """Check the type of an existing column, or of the given values of it."""
+        values = self.df[column] if values is None else values
+        
         # Map pandas/numpy types to Python types for easier comparison
         type_mapping = {
             'int': (pd.api.types.is_integer_dtype, int),
@@ -78,20 +87,35 @@ class SimpleValidator:
         
         if expected_type in type_mapping:
             type_check_func, _ = type_mapping[expected_type]
-            result = type_check_func(self.df[column])
+            result = type_check_func(values)
         else:
             # Fall back to Python type checking if pandas type check not available
-            result = all(isinstance(x, expected_type) for x in self.df[column].dropna())
+            result = all(isinstance(x, expected_type) for x in values.dropna())
         
-        self._add_result(f"Column '{column}' values are of type {expected_type}", result)
         return result
     
-    def expect_column_values_to_be_unique(self, column):
-        """Check if all values in a column are unique."""
-        if not self.expect_column_to_exist(column):
+    def _record_not_null(self, column, null_count):
+        """Record the outcome of a not-null expectation."""
+        result = null_count == 0
+        self._add_result(f"Column '{column}' has no null values", result, 
+                         details=f"{null_count} null values found" if not result else "")
+        return result
+    
+    def _record_between(self, column, min_value, max_value, count, min_actual, max_actual):
+        """Record the outcome of a range expectation from the non-null count, min and max."""
+        if count == 0:
+            self._add_result(f"Column '{column}' values between {min_value} and {max_value}", False,
+                            details="Column has no non-null values")
             return False
         
-        duplicate_count = self.df[column].duplicated().sum()
+        result = (min_actual >= min_value) and (max_actual <= max_value)
+        
+        self._add_result(f"Column '{column}' values between {min_value} and {max_value}", result,
+                         details=f"Range is {min_actual} to {max_actual}" if not result else "")
+        return result
+    
+    def _record_unique(self, column, duplicate_count):
+        """Record the outcome of a uniqueness expectation."""
         result = duplicate_count == 0
         
         self._add_result(f"Column '{column}' values are unique", result,
@@ -126,45 +150,579 @@ class SimpleValidator:
         
         return success_count == total
 
-def validate_covid_data(df):
+class ColumnStats:
+    """
+    Statistics of a single column, computed together for all of its expectations.
+    
+    The missing values are counted once and every requested statistic is
+    computed with a reduction that skips them, instead of filtering the
+    column again for every expectation. For numeric columns the null count,
+    min and max are computed in a single pass over the column, one block
+    at a time. The distinct count is only computed for uniqueness checks.
+    """
+    
+    def __init__(self, series, bounds=False, unique=False, approximate=False):
+        """
+        Compute the statistics of a column.
+        
+        Args:
+            series (pandas.Series): The column
+            bounds (bool, optional): Whether to compute the min and max
+            unique (bool, optional): Whether to compute the number of distinct values
+            approximate (bool, optional): Estimate the number of distinct values with a
+                                          HyperLogLog sketch instead of counting them
+        """
+        self.count = len(series)
+        self.dtype = series.dtype
+        self.min = None
+        self.max = None
+        self.n_unique = None
+        self.sketch = None
+        
+        if isinstance(self.dtype, np.dtype) and self.dtype.kind in 'iuf':
+            self.null_count, low, high = _reduce_numbers(series.to_numpy(), bounds)
+            self.non_null_count = self.count - self.null_count
+            if bounds and self.non_null_count:
+                self.min, self.max = low, high
+        else:
+            self.null_count = series.isna().sum()
+            self.non_null_count = self.count - self.null_count
+            
+            # The reductions skip missing values
+            if bounds and self.non_null_count:
+                self.min = series.min()
+                self.max = series.max()
+        
+        if unique and approximate:
+            self.sketch = HyperLogLog()
+            self.sketch.add(series)
+            self.n_unique = self.sketch.count()
+        elif unique:
+            self.n_unique = series.nunique()
+    
+    @classmethod
+    def missing(cls, rows, unique=False):
+        """
+        Statistics of a column part without values, like rows of chunks that lack the column.
+        
+        Args:
+            rows (int): Number of rows
+            unique (bool, optional): Whether to start a distinct count sketch
+            
+        Returns:
+            ColumnStats: Statistics of rows missing values
+        """
+        # Built from the row count alone, a Series of the rows could be as
+        # large as everything streamed so far
+        stats = cls.__new__(cls)
+        stats.count = rows
+        stats.dtype = np.dtype(np.float64)
+        stats.null_count = rows
+        stats.non_null_count = 0
+        stats.min = None
+        stats.max = None
+        stats.sketch = HyperLogLog() if unique else None
+        stats.n_unique = 0.0 if unique else None
+        return stats
+    
+    def merge(self, other):
+        """
+        Merge the statistics of the next part of the column, as if the parts were concatenated.
+        
+        Distinct counts are merged through their HyperLogLog sketches, so parts
+        with distinct counts must be computed with approximate=True.
+        
+        Args:
+            other (ColumnStats): Statistics of the next part of the column
+        """
+        self.count += other.count
+        self.null_count += other.null_count
+        self.non_null_count += other.non_null_count
+        self.dtype = _common_dtype(self.dtype, other.dtype)
+        
+        # Combine the bounds of the parts that have any
+        if other.min is not None:
+            if self.min is None:
+                self.min, self.max = other.min, other.max
+            else:
+                self.min = min(self.min, other.min)
+                self.max = max(self.max, other.max)
+        
+        # Report the bounds in the type of the concatenated column
+        if self.min is not None and _is_number(self.dtype) and isinstance(self.dtype, np.dtype):
+            self.min = self.dtype.type(self.min)
+            self.max = self.dtype.type(self.max)
+        
+        if other.sketch is not None:
+            if self.sketch is None:
+                self.sketch = HyperLogLog(other.sketch.precision)
+            self.sketch.merge(other.sketch)
+        self.n_unique = self.sketch.count() if self.sketch is not None else None
+    
+    @property
+    def duplicate_count(self):
+        """
+        Number of values that repeat an earlier one, like Series.duplicated().sum().
+        
+        Estimates from a sketch that are within its 95% error count as no duplicates.
+        """
+        # All missing values count as one distinct value
+        distinct = self.n_unique + (1 if self.null_count else 0)
+        duplicates = self.count - distinct
+        if self.sketch is None:
+            return duplicates
+        
+        margin = CONFIDENCE_Z * self.sketch.relative_error * self.n_unique
+        return int(round(duplicates)) if duplicates > margin else 0
+
+class CompiledValidator(SimpleValidator):
+    """
+    Validator that registers all expectations first and evaluates them together.
+    
+    The expectation methods only record the expectation and return None.
+    validate() then computes one ColumnStats per column with everything its
+    expectations need, and evaluates the expectations in the order they were
+    registered, giving the same results as SimpleValidator.
+    """
+    
+    def __init__(self, df):
+        """
+        Initialize validator with a DataFrame.
+        
+        Args:
+            df (pandas.DataFrame): The DataFrame to validate
+        """
+        super().__init__(df)
+        self.expectations = []
+    
+    def expect_column_to_exist(self, column):
+        """Register a check that a column exists in the DataFrame."""
+        self.expectations.append(('exist', column, {}))
+    
+    def expect_column_values_to_not_be_null(self, column):
+        """Register a check that a column has no null values."""
+        self.expectations.append(('not_null', column, {}))
+    
+    def expect_column_values_to_be_between(self, column, min_value, max_value):
+        """Register a check that all values in a column are between min_value and max_value."""
+        self.expectations.append(('between', column, {'min_value': min_value, 'max_value': max_value}))
+    
+    def expect_column_values_to_be_of_type(self, column, expected_type):
+        """Register a check that all values in a column are of the expected type."""
+        self.expectations.append(('type', column, {'expected_type': expected_type}))
+    
+    def expect_column_values_to_be_unique(self, column):
+        """Register a check that all values in a column are unique."""
+        self.expectations.append(('unique', column, {}))
+    
+    def compute_stats(self):
+        """
+        Compute the statistics needed by the registered expectations, one column at a time.
+        
+        Returns:
+            dict: Dictionary mapping column names to their ColumnStats
+        """
+        needs = self._column_needs()
+        return {column: ColumnStats(self.df[column], **column_needs) for column, column_needs in needs.items()}
+    
+    def _column_needs(self):
+        """Find the statistics each existing column needs for its expectations."""
+        needs = {}
+        for kind, column, _ in self.expectations:
+            if kind == 'exist' or not self._has_column(column):
+                continue
+            
+            column_needs = needs.setdefault(column, {'bounds': False, 'unique': False})
+            if kind == 'between':
+                column_needs['bounds'] = True
+            elif kind == 'unique':
+                column_needs['unique'] = True
+        
+        return needs
+    
+    def _has_column(self, column):
+        """Check if the validated data has a column."""
+        return column in self.df.columns
+    
+    def evaluate(self, stats):
+        """
+        Evaluate the registered expectations against the column statistics.
+        
+        Args:
+            stats (dict): Dictionary mapping column names to their ColumnStats
+        """
+        self.validation_results = []
+        
+        for kind, column, options in self.expectations:
+            # Every expectation first checks that its column exists
+            exists = self._has_column(column)
+            self._add_result(f"Column '{column}' exists", exists)
+            if kind == 'exist' or not exists:
+                continue
+            
+            column_stats = stats[column]
+            if kind == 'not_null':
+                self._record_not_null(column, column_stats.null_count)
+            elif kind == 'between':
+                self._record_between(column, options['min_value'], options['max_value'],
+                                     column_stats.non_null_count, column_stats.min, column_stats.max)
+            elif kind == 'type':
+                result = self._check_type(column, options['expected_type'])
+                self._add_result(f"Column '{column}' values are of type {options['expected_type']}", result)
+            elif kind == 'unique':
+                self._record_unique(column, column_stats.duplicate_count)
+    
+    def validate(self):
+        """Evaluate the registered expectations and get a summary of the results."""
+        self.evaluate(self.compute_stats())
+        return super().validate()
+
+class SampledValidator(CompiledValidator):
+    """
+    Validator that evaluates the expectations on a uniform sample of the rows.
+    
+    Null, range and type checks are evaluated on the sample, and their
+    results carry the upper 95% confidence bound of the violation rate of
+    the whole column. Uniqueness is checked on all rows, with a HyperLogLog
+    estimate of the number of distinct values.
+    """
+    
+    def __init__(self, df, sample_fraction=None, sample_size=None, seed=0):
+        """
+        Initialize validator with a DataFrame.
+        
+        Args:
+            df (pandas.DataFrame): The DataFrame to validate
+            sample_fraction (float, optional): Fraction of the rows to sample
+            sample_size (int, optional): Number of rows to sample, used if no fraction is given
+            seed (int, optional): Random seed of the sample
+        """
+        super().__init__(df)
+        self.positions = sample_positions(len(df), fraction=sample_fraction, size=sample_size, seed=seed)
+        self.exact = self.positions is None
+        self.sample_size = len(df) if self.exact else len(self.positions)
+    
+    def compute_stats(self):
+        """
+        Compute the statistics needed by the registered expectations.
+        
+        Returns:
+            dict: Dictionary mapping column names to the ColumnStats of the sample and,
+                  for uniqueness checks, the approximate ColumnStats of all rows
+        """
+        stats = {}
+        for column, column_needs in self._column_needs().items():
+            sample_stats = ColumnStats(self.sampled(column), bounds=column_needs['bounds'])
+            column_stats = None
+            if column_needs['unique']:
+                column_stats = ColumnStats(self.df[column], unique=True, approximate=True)
+            stats[column] = (sample_stats, column_stats)
+        
+        return stats
+    
+    def evaluate(self, stats):
+        """
+        Evaluate the registered expectations against the column statistics.
+        
+        Args:
+            stats (dict): Dictionary mapping column names to their statistics, see compute_stats()
+        """
+        self.validation_results = []
+        
+        for kind, column, options in self.expectations:
+            # Every expectation first checks that its column exists
+            exists = column in self.df.columns
+            self._add_result(f"Column '{column}' exists", exists)
+            if kind == 'exist' or not exists:
+                continue
+            
+            sample_stats, column_stats = stats[column]
+            if kind == 'not_null':
+                self._record_not_null(column, sample_stats.null_count)
+                self._add_sample_confidence(sample_stats.null_count, sample_stats.count)
+            
+            elif kind == 'between':
+                min_value, max_value = options['min_value'], options['max_value']
+                count = sample_stats.non_null_count
+                self._record_between(column, min_value, max_value, count, sample_stats.min, sample_stats.max)
+                
+                # Count the violations only if the sample has any
+                violations = 0
+                if count and not (sample_stats.min >= min_value and sample_stats.max <= max_value):
+                    values = self.sampled(column)
+                    violations = int(((values < min_value) | (values > max_value)).sum())
+                self._add_sample_confidence(violations, count)
+            
+            elif kind == 'type':
+                result = self._check_type(column, options['expected_type'], values=self.sampled(column))
+                self._add_result(f"Column '{column}' values are of type {options['expected_type']}", result)
+            
+            elif kind == 'unique':
+                self._record_unique(column, column_stats.duplicate_count)
+                self._add_confidence(method='hyperloglog', distinct_estimate=int(round(column_stats.n_unique)),
+                                     relative_error=round(column_stats.sketch.relative_error, 4))
+    
+    def validate(self):
+        """Evaluate the registered expectations on the sample and get a summary of the results."""
+        logger.info(f"Validating a sample of {self.sample_size} of {len(self.df)} rows")
+        valid = super().validate()
+        
+        # Report how many violations the passed sampled checks may have missed
+        bounds = [result['confidence']['max_violation_rate'] for result in self.validation_results
+                  if result['success'] and 'max_violation_rate' in result.get('confidence', {})]
+        if bounds:
+            logger.info(f"Passed sampled checks have violation rates of at most {max(bounds):.4%} "
+                        f"(95% confidence)")
+        
+        return valid
+    
+    def sampled(self, column):
+        """Get the sampled values of a column."""
+        if self.exact:
+            return self.df[column]
+        return self.df[column].iloc[self.positions]
+    
+    def _add_sample_confidence(self, violations, sampled):
+        """Attach the confidence of a check evaluated on the sample to the last result."""
+        upper_bound = violation_rate_upper_bound(violations, sampled, exact=self.exact)
+        self._add_confidence(method='exact' if self.exact else 'sample', sampled_values=int(sampled),
+                             violations=int(violations), max_violation_rate=float(upper_bound))
+    
+    def _add_confidence(self, **confidence):
+        """Attach confidence information to the last result."""
+        self.validation_results[-1]['confidence'] = dict(confidence, level=0.95)
+
+class StreamingValidator(CompiledValidator):
+    """
+    Validator that accumulates column statistics one chunk at a time.
+    
+    Every chunk passed to update() is reduced to a ColumnStats per column
+    and merged into the statistics of the earlier chunks: value and null
+    counts, the dtype, the min and max of numeric columns and, for
+    uniqueness checks, a HyperLogLog sketch. validate() evaluates the
+    registered expectations on the merged statistics, as if the chunks had
+    been concatenated. Uniqueness and Python type checks need the values,
+    so they must be registered before the first chunk.
+    """
+    
+    def __init__(self):
+        """Initialize validator without any data."""
+        super().__init__(None)
+        self.stats = {}
+        self.rows = 0
+        self._type_flags = {}
+    
+    @property
+    def columns(self):
+        """Columns of the chunks, in the order they first appeared."""
+        return list(self.stats)
+    
+    @property
+    def numeric_columns(self):
+        """Columns that are numeric in the concatenated chunks."""
+        return [column for column, column_stats in self.stats.items() if _is_number(column_stats.dtype)]
+    
+    def update(self, chunk):
+        """
+        Accumulate the statistics of the next chunk.
+        
+        Args:
+            chunk (pandas.DataFrame): The next chunk of the data
+        """
+        unique_columns = {column for kind, column, _ in self.expectations if kind == 'unique'}
+        bounds_columns = {column for kind, column, _ in self.expectations if kind == 'between'}
+        
+        for column in chunk.columns:
+            series = chunk[column]
+            unique = column in unique_columns
+            chunk_stats = ColumnStats(series, bounds=column in bounds_columns or _is_number(series.dtype),
+                                      unique=unique, approximate=True)
+            
+            if column in self.stats:
+                self.stats[column].merge(chunk_stats)
+            elif self.rows:
+                # The rows of the earlier chunks have no value in a new column
+                self.stats[column] = ColumnStats.missing(self.rows, unique=unique)
+                self.stats[column].merge(chunk_stats)
+            else:
+                self.stats[column] = chunk_stats
+        
+        # Neither do the rows of this chunk in the columns it lacks
+        for column, column_stats in self.stats.items():
+            if column not in chunk.columns:
+                column_stats.merge(ColumnStats.missing(len(chunk), unique=column in unique_columns))
+        
+        # Python type checks are evaluated on every chunk
+        for kind, column, options in self.expectations:
+            if kind == 'type' and not isinstance(options['expected_type'], str) and column in chunk.columns:
+                key = (column, options['expected_type'])
+                result = super()._check_type(column, options['expected_type'], values=chunk[column])
+                self._type_flags[key] = self._type_flags.get(key, True) and result
+        
+        self.rows += len(chunk)
+    
+    def compute_stats(self):
+        """
+        Get the merged statistics of the chunks.
+        
+        Returns:
+            dict: Dictionary mapping column names to their ColumnStats
+        """
+        return self.stats
+    
+    def _has_column(self, column):
+        """Check if any chunk had a column."""
+        return column in self.stats
+    
+    def _check_type(self, column, expected_type, values=None):
+        """Check the type of a column from its merged dtype, or from the checks of its chunks."""
+        key = (column, expected_type)
+        if key in self._type_flags:
+            return self._type_flags[key]
+        
+        return super()._check_type(column, expected_type, values=pd.Series(dtype=self.stats[column].dtype))
+
+def _reduce_numbers(values, bounds):
+    """
+    Count the NaN values of a numeric array and find its min and max, in one pass over memory.
+    
+    Every block is counted and reduced while it is in the CPU cache, instead
+    of reading the whole array from memory once per statistic. fmin and fmax
+    skip NaN, so no copy of the values without them is made.
+    
+    Args:
+        values (numpy.ndarray): Integer or float values
+        bounds (bool): Whether to find the min and max
+        
+    Returns:
+        tuple: Number of NaN values, and the min and max of the other values (None if
+               not requested or there are none)
+    """
+    null_count = 0
+    low = high = None
+    
+    for start in range(0, len(values), REDUCE_BLOCK_SIZE):
+        block = values[start:start + REDUCE_BLOCK_SIZE]
+        
+        # Only floats can hold NaN
+        if values.dtype.kind == 'f':
+            null_count += int(np.count_nonzero(np.isnan(block)))
+        
+        if bounds:
+            block_low, block_high = np.fmin.reduce(block), np.fmax.reduce(block)
+            low = block_low if low is None else np.fmin(low, block_low)
+            high = block_high if high is None else np.fmax(high, block_high)
+    
+    # A block of NaN only reduces to NaN
+    if low is not None and np.isnan(low):
+        low = high = None
+    
+    return null_count, low, high
+
+def _is_number(dtype):
+    """Check if a dtype is numeric, like select_dtypes(include=['number'])."""
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+def _common_dtype(left, right):
+    """Get the dtype of the concatenation of two columns."""
+    if left == right:
+        return left
+    
+    if all(isinstance(dtype, np.dtype) and _is_number(dtype) for dtype in (left, right)):
+        return np.result_type(left, right)
+    
+    return np.dtype(object)
+
+# Validator class of each validation mode
+VALIDATORS = {
+    'exact': SimpleValidator,
+    'compiled': CompiledValidator,
+    'sampled': SampledValidator
+}
+
+def validate_covid_data(df, mode="exact", sample_fraction=None, sample_size=None):
     """
     Validate COVID-19 data using common expectations.
     
     Args:
         df (pandas.DataFrame): DataFrame to validate
-        
+        mode (str, optional): Validation mode
+                              - "exact": Evaluate each expectation as it is declared
+                              - "compiled": Evaluate all expectations together with
+                                one set of statistics per column
+                              - "sampled": Evaluate the expectations on a sample of
+                                the rows, reporting confidence bounds
+        sample_fraction (float, optional): Fraction of the rows to sample in "sampled" mode
+        sample_size (int, optional): Number of rows to sample in "sampled" mode, used if
+                                     no fraction is given
+                                     
     Returns:
         bool: True if all validations pass, False otherwise
     """
-    logger.info("Starting data validation")
+    if mode not in VALIDATORS:
+        raise ValueError(f"Unknown validation mode: {mode}")
+    
+    logger.info(f"Starting data validation ({mode})")
     
     try:
-        validator = SimpleValidator(df)
-        
-        # Common columns to check
-        date_column = next((col for col in df.columns if 'date' in col.lower()), None)
-        location_column = next((col for col in df.columns if any(loc in col.lower() for loc in ['region', 'location', 'state'])), None)
-        
-        # Basic validation checks
-        if date_column:
-            validator.expect_column_to_exist(date_column)
-            validator.expect_column_values_to_not_be_null(date_column)
-        
-        if location_column:
-            validator.expect_column_to_exist(location_column)
-            validator.expect_column_values_to_not_be_null(location_column)
-        
-        # Check numeric columns for reasonable ranges
-        numeric_columns = df.select_dtypes(include=['number']).columns
-        for col in numeric_columns:
-            if 'rate' in col.lower() or 'percentage' in col.lower():
-                validator.expect_column_values_to_be_between(col, 0, 100)
-            elif any(term in col.lower() for term in ['cases', 'deaths', 'tests', 'vaccinations']):
-                validator.expect_column_values_to_be_between(col, 0, float('inf'))
+        options = {}
+        if mode == "sampled":
+            options = {'sample_fraction': sample_fraction, 'sample_size': sample_size}
+        validator = VALIDATORS[mode](df, **options)
+        expect_covid_data(validator, df.columns, df.select_dtypes(include=['number']).columns)
         
         # Run validation and return result
         return validator.validate()
     
     except Exception as e:
         logger.error(f"Error validating data: {e}")
-        return False
\ No newline at end of file
+        return False
+
+def validate_covid_stream(validator):
+    """
+    Validate COVID-19 data accumulated chunk by chunk, with the expectations of validate_covid_data.
+    
+    Args:
+        validator (StreamingValidator): Validator updated with every chunk of the data
+        
+    Returns:
+        bool: True if all validations pass, False otherwise
+    """
+    logger.info(f"Starting streaming data validation of {validator.rows} rows")
+    
+    try:
+        expect_covid_data(validator, validator.columns, validator.numeric_columns)
+        return validator.validate()
+    
+    except Exception as e:
+        logger.error(f"Error validating data: {e}")
+        return False
+
+def expect_covid_data(validator, columns, numeric_columns):
+    """
+    Register the common expectations of COVID-19 data on a validator.
+    
+    Args:
+        validator (SimpleValidator): Validator to register the expectations on
+        columns (list): Columns of the data
+        numeric_columns (list): Numeric columns of the data
+    """
+    # Common columns to check
+    date_column = next((col for col in columns if 'date' in col.lower()), None)
+    location_column = next((col for col in columns if any(loc in col.lower() for loc in ['region', 'location', 'state'])), None)
+    
+    # Basic validation checks
+    if date_column:
+        validator.expect_column_to_exist(date_column)
+        validator.expect_column_values_to_not_be_null(date_column)
+    
+    if location_column:
+        validator.expect_column_to_exist(location_column)
+        validator.expect_column_values_to_not_be_null(location_column)
+    
+    # Check numeric columns for reasonable ranges
+    for col in numeric_columns:
+        if 'rate' in col.lower() or 'percentage' in col.lower():
+            validator.expect_column_values_to_be_between(col, 0, 100)
+        elif any(term in col.lower() for term in ['cases', 'deaths', 'tests', 'vaccinations']):
+            validator.expect_column_values_to_be_between(col, 0, float('inf'))
\ No newline at end of file
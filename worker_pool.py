@@ -0,0 +1,45 @@
+"""
+Pools of worker processes that log through the pipeline's log handlers.
+
+Workers are started with the 'spawn' method, so they never inherit locks
+held by the pipeline's threads. The module imports no project modules,
+so that modules using a pool, such as the NDJSON extractor, do not
+depend on the transformers.
+"""
+import logging
+import logging.handlers
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+
+@contextmanager
+def process_pool(max_workers):
+    """
+    Start a pool of worker processes that log through this process's handlers.
+    
+    Args:
+        max_workers (int): Number of worker processes
+        
+    Yields:
+        concurrent.futures.ProcessPoolExecutor: The process pool
+    """
+    context = multiprocessing.get_context('spawn')
+    log_queue = context.Queue()
+    
+    # Write the log records of the workers to the pipeline's log handlers
+    root_logger = logging.getLogger()
+    listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    listener.start()
+    
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker,
+                                 initargs=(log_queue, root_logger.level)) as executor:
+            yield executor
+    finally:
+        listener.stop()
+
+def _init_worker(log_queue, log_level):
+    """Send the log records of a worker process to the parent process."""
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(log_level)